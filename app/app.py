@@ -54,6 +54,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_db() -> CSVDatabase:
+    """Satu instance CSVDatabase per proses (shared antar session)"""
+    return CSVDatabase()
+
+
 def init_session_state():
     """Initialize session state variables"""
     if "authenticated" not in st.session_state:
@@ -72,8 +78,14 @@ def main():
     # Initialize
     init_session_state()
     auth = SimpleAuth()
-    db = CSVDatabase()
-    
+    db = get_db()
+
+    # Merge verifikasi pending dari sesi sebelumnya (sekali per sesi)
+    if not st.session_state.get("_pending_flushed"):
+        db.flush_pending()
+        st.session_state["_pending_flushed"] = True
+
+
     # Check authentication
     if not auth.login_form():
         return
@@ -5,8 +5,70 @@ Simple authentication system untuk Streamlit
 import streamlit as st
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 import hashlib
+import hmac
+
+
+# Parameter scrypt (stdlib, tidak perlu dependency baru)
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+
+@st.cache_resource
+def _load_users_cached(users_file: str, mtime: float) -> dict:
+    """
+    Load + parse users file sekali per process, keyed pada mtime
+    supaya rerun Streamlit tidak membaca ulang JSON dari disk
+    """
+    with open(users_file, "r") as f:
+        users = json.load(f)
+
+    # Precompute hash/salt bytes sekali di load time, supaya verify
+    # tidak perlu hex-decode per login attempt
+    for user in users.values():
+        try:
+            if "hash" in user:
+                # Format baru: scrypt + per-user salt
+                user["_pw_bytes"] = bytes.fromhex(user.get("hash", ""))
+                user["_salt"] = bytes.fromhex(user.get("salt", ""))
+            else:
+                # Format lama: SHA-256 tanpa salt
+                user["_pw_bytes"] = bytes.fromhex(user.get("password_hash", ""))
+        except ValueError:
+            user["_pw_bytes"] = b""
+
+    return users
+
+
+@lru_cache(maxsize=128)
+def _hash_password_cached(password: str) -> str:
+    """Hash password using SHA256 (memoized untuk rerun berulang)"""
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _hash_password_bytes(password: str) -> bytes:
+    """SHA256 digest sebagai bytes, untuk constant-time compare"""
+    return hashlib.sha256(password.encode()).digest()
+
+
+def _scrypt_hash(password: str, salt: bytes) -> bytes:
+    """Derive password hash dengan scrypt (sengaja lambat, 1x per login)"""
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=_SCRYPT_N,
+        r=_SCRYPT_R,
+        p=_SCRYPT_P,
+    )
+
+
+def _password_fingerprint(username: str, password: str) -> str:
+    """Fingerprint (username, password) untuk short-circuit antar rerun"""
+    return hashlib.sha256(f"{username}\x00{password}".encode()).hexdigest()
 
 
 class SimpleAuth:
@@ -22,25 +84,46 @@ class SimpleAuth:
             os.makedirs(os.path.dirname(self.users_file), exist_ok=True)
             
             # Default user: admin / admin123
+            salt = os.urandom(16)
             default_users = {
                 "admin": {
-                    "password_hash": self._hash_password("admin123"),
+                    "salt": salt.hex(),
+                    "hash": _scrypt_hash("admin123", salt).hex(),
                     "role": "admin"
                 }
             }
-            
+
             with open(self.users_file, "w") as f:
                 json.dump(default_users, f, indent=2)
-    
+
     def _hash_password(self, password: str) -> str:
-        """Hash password using SHA256"""
-        return hashlib.sha256(password.encode()).hexdigest()
-    
-    def _load_users(self) -> dict:
-        """Load users from file"""
+        """Hash password using SHA256 (legacy format, untuk migrasi)"""
+        return _hash_password_cached(password)
+
+    def _upgrade_legacy_user(self, username: str, password: str):
+        """Upgrade user format lama (SHA-256) ke scrypt + salt"""
         try:
             with open(self.users_file, "r") as f:
-                return json.load(f)
+                users = json.load(f)
+
+            salt = os.urandom(16)
+            users[username].pop("password_hash", None)
+            users[username]["salt"] = salt.hex()
+            users[username]["hash"] = _scrypt_hash(password, salt).hex()
+
+            with open(self.users_file, "w") as f:
+                json.dump(users, f, indent=2)
+
+            _load_users_cached.clear()
+        except Exception as e:
+            # Gagal upgrade tidak boleh menggagalkan login
+            st.warning(f"Gagal upgrade format password: {e}")
+
+    def _load_users(self) -> dict:
+        """Load users from file (cached per mtime)"""
+        try:
+            mtime = os.path.getmtime(self.users_file)
+            return _load_users_cached(self.users_file, mtime)
         except Exception as e:
             st.error(f"Error loading users: {e}")
             return {}
@@ -52,13 +135,34 @@ class SimpleAuth:
         Returns:
             True if credentials valid
         """
+        # Short-circuit: rerun Streamlit dengan kredensial yang sama
+        # tidak perlu re-KDF (scrypt sengaja lambat)
+        fingerprint = _password_fingerprint(username, password)
+        if st.session_state.get("_auth_pw_fp") == fingerprint:
+            return True
+
         users = self._load_users()
-        
+
         if username not in users:
             return False
-        
-        password_hash = self._hash_password(password)
-        return users[username]["password_hash"] == password_hash
+
+        user = users[username]
+        stored = user.get("_pw_bytes", b"")
+
+        if "_salt" in user:
+            # Format baru: scrypt + per-user salt
+            computed = _scrypt_hash(password, user["_salt"])
+            valid = hmac.compare_digest(stored, computed)
+        else:
+            # Format lama: SHA-256; upgrade ke scrypt setelah login sukses
+            valid = hmac.compare_digest(stored, _hash_password_bytes(password))
+            if valid:
+                self._upgrade_legacy_user(username, password)
+
+        if valid:
+            st.session_state["_auth_pw_fp"] = fingerprint
+
+        return valid
     
     def get_user_role(self, username: str) -> str:
         """Get user role"""
@@ -105,6 +209,7 @@ class SimpleAuth:
         st.session_state["authenticated"] = False
         st.session_state["username"] = None
         st.session_state["role"] = None
+        st.session_state.pop("_auth_pw_fp", None)
         st.rerun()
     
     @staticmethod
@@ -3,57 +3,68 @@ Dashboard page - Overview statistics and recent articles
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import pytz
 
+from app.ui.data_cache import (
+    load_articles_cached,
+    dashboard_aggregates,
+    get_statistics_cached,
+    get_metadata_cached,
+    file_mtime,
+)
 
+
+@st.fragment
 def show_dashboard(db):
-    """Display dashboard with statistics and overview"""
-    
+    """Display dashboard with statistics and overview
+
+    Dibungkus st.fragment supaya interaksi sidebar/widget lain tidak
+    memicu rerun dashboard (load + agregasi) di luar scope-nya
+    """
+
     st.markdown('<div class="main-header">📊 Dashboard</div>', unsafe_allow_html=True)
     st.markdown("---")
-    
-    # Load data
-    df = db.load_articles()
-    stats = db.get_statistics()
-    metadata = db.get_metadata()
-    
-    # Statistics cards
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-value">{stats['total']}</div>
-            <div class="stat-label">Total Artikel</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-value" style="color: #d6b924;">{stats['unverified']}</div>
-            <div class="stat-label">Belum Diverifikasi</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-value" style="color: #26de3b;">{stats['verified_true']}</div>
-            <div class="stat-label">Verified Bencana</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-value" style="color: #f43636;">{stats['verified_false']}</div>
-            <div class="stat-label">Verified Bukan</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
+
+    # Load data (cached, hanya kolom yang dipakai dashboard,
+    # artikel deleted sudah difilter di level reader)
+    df = load_articles_cached(
+        db,
+        file_mtime(db.csv_path),
+        columns=(
+            'tanggal_wib', 'waktu_wib', 'judul', 'lokasi_kejadian',
+            'jenis_bencana', 'sumber', 'status_verifikasi',
+            'datetime_wib', 'is_deleted',
+        ),
+        drop_deleted=True,
+    )
+    stats = get_statistics_cached(db, file_mtime(db.csv_path))
+    metadata = get_metadata_cached(db, file_mtime(db.metadata_path))
+    
+    # Statistics cards — satu st.markdown (satu elemen frontend),
+    # bukan 4 kolom + 4 markdown terpisah per rerun
+    def stat_card(value, label, color=None):
+        style = f' style="color: {color};"' if color else ''
+        return (
+            f'<div class="stat-card">'
+            f'<div class="stat-value"{style}>{value}</div>'
+            f'<div class="stat-label">{label}</div>'
+            f'</div>'
+        )
+
+    cards = (
+        stat_card(stats['total'], 'Total Artikel')
+        + stat_card(stats['unverified'], 'Belum Diverifikasi', '#d6b924')
+        + stat_card(stats['verified_true'], 'Verified Bencana', '#26de3b')
+        + stat_card(stats['verified_false'], 'Verified Bukan', '#f43636')
+    )
+
+    st.markdown(
+        f"<div style='display: grid; grid-template-columns: repeat(4, 1fr); "
+        f"gap: 1rem;'>{cards}</div>",
+        unsafe_allow_html=True
+    )
+
     st.markdown("---")
     
     # Last scrape info
@@ -84,18 +95,18 @@ def show_dashboard(db):
     if df.empty:
         st.warning("Belum ada data artikel. Jalankan scraping terlebih dahulu.")
         return
-    
-    # Filter deleted articles
-    if 'is_deleted' in df.columns:
-        df = df[~df['is_deleted']]
-    
-    # Sort by datetime
+
+    # Parse datetime sekali saja di atas; reader biasanya sudah
+    # memparse, jadi ini cuma guard (format ISO8601 = fast path)
+    if 'datetime_wib' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['datetime_wib']):
+        df['datetime_wib'] = pd.to_datetime(df['datetime_wib'], errors='coerce', format='ISO8601')
+
+    # Display recent 20 articles — nlargest = partial select O(N),
+    # tidak perlu full sort; chart di bawah tidak butuh urutan
     if 'datetime_wib' in df.columns:
-        df['datetime_wib'] = pd.to_datetime(df['datetime_wib'], errors='coerce')
-        df = df.sort_values('datetime_wib', ascending=False)
-    
-    # Display recent 20 articles
-    recent_df = df.head(20)
+        recent_df = df.nlargest(20, 'datetime_wib')
+    else:
+        recent_df = df.head(20)
     
     # Prepare display columns
     display_columns = ['tanggal_wib', 'waktu_wib', 'judul', 'lokasi_kejadian', 
@@ -121,27 +132,23 @@ def show_dashboard(db):
     display_df = recent_df[display_columns].copy()
     display_df = display_df.rename(columns=column_names)
     
-    # Style status column
-    def highlight_status(row):
-        if 'Status' not in row:
-            return [''] * len(row)
-        
-        status = row['Status']
-        colors = [''] * len(row)
-        
-        if status == 'UNVERIFIED':
-            colors[-1] = 'background-color: #ffcd2e'
-        elif status == 'VERIFIED_TRUE':
-            colors[-1] = 'background-color: #1bfa51'
-        elif status == 'VERIFIED_FALSE':
-            colors[-1] = 'background-color: #ff2e41'
-        
-        return colors
-    
+    # Style status column (vectorized: satu pass np.select per kolom,
+    # bukan Python function per baris)
+    def style_status(col):
+        return np.select(
+            [col == 'UNVERIFIED', col == 'VERIFIED_TRUE', col == 'VERIFIED_FALSE'],
+            [
+                'background-color: #ffcd2e',
+                'background-color: #1bfa51',
+                'background-color: #ff2e41',
+            ],
+            default=''
+        )
+
     # Display with styling
     if 'Status' in display_df.columns:
         st.dataframe(
-            display_df.style.apply(highlight_status, axis=1),
+            display_df.style.apply(style_status, subset=['Status']),
             width='stretch',
             hide_index=True,
             height=600
@@ -149,50 +156,35 @@ def show_dashboard(db):
     else:
         st.dataframe(display_df, width='stretch', hide_index=True, height=600)
     
-    # Charts
+    # Charts (agregasi di-cache per mtime CSV, bukan dihitung per rerun)
+    aggs = dashboard_aggregates(db, file_mtime(db.csv_path))
+
     st.markdown("---")
     st.subheader("📊 Statistik")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.markdown("**Distribusi Jenis Bencana**")
-        if 'jenis_bencana' in df.columns:
-            disaster_counts = df['jenis_bencana'].value_counts()
-            st.bar_chart(disaster_counts)
+        if aggs["disaster"] is not None:
+            st.bar_chart(aggs["disaster"])
         else:
             st.info("Data jenis bencana tidak tersedia")
-    
+
     with col2:
         st.markdown("**Distribusi Lokasi (Top 10)**")
-        if 'lokasi_kejadian' in df.columns:
-            location_counts = df['lokasi_kejadian'].value_counts().head(10)
-            st.bar_chart(location_counts)
+        if aggs["location"] is not None:
+            st.bar_chart(aggs["location"])
         else:
             st.info("Data lokasi tidak tersedia")
-    
+
     # Timeline
     st.markdown("---")
     st.subheader("📅 Timeline Artikel (7 Hari Terakhir)")
-    
-    if 'datetime_wib' in df.columns:
-        # Filter last 7 days
-        df['datetime_wib'] = pd.to_datetime(df['datetime_wib'], errors='coerce')
-        
-        # Make last_7_days timezone-aware (WIB)
-        import pytz
-        wib = pytz.timezone('Asia/Jakarta')
-        last_7_days = datetime.now(wib) - timedelta(days=7)
-        
-        recent_df = df[df['datetime_wib'] >= last_7_days]
-        
-        if not recent_df.empty:
-            # Group by date
-            recent_df['date'] = recent_df['datetime_wib'].dt.date
-            daily_counts = recent_df.groupby('date').size()
-            
-            st.line_chart(daily_counts)
-        else:
-            st.info("Tidak ada artikel dalam 7 hari terakhir")
+
+    if aggs["timeline"] is not None:
+        st.line_chart(aggs["timeline"])
+    elif 'datetime_wib' in df.columns:
+        st.info("Tidak ada artikel dalam 7 hari terakhir")
     else:
         st.info("Data timeline tidak tersedia")
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Cached data loaders untuk halaman Streamlit
+Di-cache dengan st.cache_data keyed pada mtime file, supaya rerun
+(klik radio, ganti tab, dll) tidak membaca ulang CSV dari disk
+"""
+
+import os
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import streamlit as st
+
+# Timezone WIB sekali di module scope (zoneinfo = stdlib, lebih cepat
+# dari membangun pytz.timezone per rerun)
+WIB = ZoneInfo("Asia/Jakarta")
+
+
+def file_mtime(path) -> float:
+    """
+    Get file modification time (cache key)
+
+    Args:
+        path: Path ke file
+
+    Returns:
+        mtime sebagai float, 0.0 jika file belum ada
+    """
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+@st.cache_data(ttl="5m", max_entries=4)
+def load_articles_cached(_db, mtime: float, columns=None, drop_deleted=False):
+    """
+    Load articles via db, cached per CSV mtime
+
+    Args:
+        _db: CSVDatabase instance (underscore = tidak ikut di-hash)
+        mtime: mtime CSV sebagai cache key
+        columns: Subset kolom (tuple, supaya hashable) atau None
+        drop_deleted: Buang artikel soft-deleted di level reader
+
+    Returns:
+        DataFrame of articles
+    """
+    if columns is not None or drop_deleted:
+        return _db.load_articles_parquet(
+            columns=list(columns) if columns else None,
+            drop_deleted=drop_deleted,
+        )
+    return _db.load_articles()
+
+
+@st.cache_data(ttl="5m", max_entries=4)
+def dashboard_aggregates(_db, mtime: float) -> dict:
+    """
+    Agregasi dashboard (value_counts + timeline 7 hari), cached
+
+    Pure function dari mtime CSV — rerun sidebar/radio jadi dict lookup,
+    bukan agregasi pandas O(N)
+
+    Args:
+        _db: CSVDatabase instance (underscore = tidak ikut di-hash)
+        mtime: mtime CSV sebagai cache key
+
+    Returns:
+        Dict: disaster/location value_counts dan timeline harian
+        (None kalau kolomnya tidak tersedia)
+    """
+    df = load_articles_cached(
+        _db,
+        mtime,
+        columns=('jenis_bencana', 'lokasi_kejadian', 'datetime_wib', 'is_deleted'),
+        drop_deleted=True,
+    )
+
+    aggs = {"disaster": None, "location": None, "timeline": None}
+
+    if df.empty:
+        return aggs
+
+    if 'jenis_bencana' in df.columns:
+        aggs["disaster"] = df['jenis_bencana'].value_counts()
+
+    if 'lokasi_kejadian' in df.columns:
+        aggs["location"] = df['lokasi_kejadian'].value_counts().head(10)
+
+    if 'datetime_wib' in df.columns:
+        cutoff = pd.Timestamp.now(tz=WIB) - pd.Timedelta(days=7)
+        recent = df[df['datetime_wib'] >= cutoff]
+        if not recent.empty:
+            aggs["timeline"] = recent.groupby(recent['datetime_wib'].dt.date).size()
+
+    return aggs
+
+
+@st.cache_data(ttl="5m", max_entries=4)
+def load_unverified_cached(_db, mtime: float, log_mtime: float):
+    """
+    Artikel unverified, cached per mtime CSV + mtime log pending
+
+    Log pending ikut jadi key karena satu klik verifikasi mengubah
+    daftar unverified tanpa menyentuh CSV
+
+    Args:
+        _db: CSVDatabase instance (underscore = tidak ikut di-hash)
+        mtime: mtime CSV sebagai cache key
+        log_mtime: mtime verifications.jsonl sebagai cache key
+
+    Returns:
+        DataFrame artikel yang belum diverifikasi
+    """
+    return _db.get_unverified_articles()
+
+
+@st.cache_data(ttl="5m", max_entries=4)
+def get_statistics_cached(_db, mtime: float) -> dict:
+    """Statistik database, cached per mtime CSV"""
+    return _db.get_statistics()
+
+
+@st.cache_data(ttl="5m", max_entries=4)
+def get_metadata_cached(_db, mtime: float) -> dict:
+    """Metadata scraping, cached per mtime file metadata"""
+    return _db.get_metadata()
+
+
+def clear_article_caches():
+    """Invalidate cached articles (panggil setelah scraping/delete/verify)"""
+    load_articles_cached.clear()
+    dashboard_aggregates.clear()
+    load_unverified_cached.clear()
+    get_statistics_cached.clear()
+    get_metadata_cached.clear()
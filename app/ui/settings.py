@@ -3,15 +3,20 @@ Settings page - Scraping, export, dan management
 """
 
 import streamlit as st
-import sys
+import io
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
 
-# Add parent to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from scraper.google_news_scraper import GoogleNewsScraper
+from app.ui.data_cache import (
+    load_articles_cached,
+    get_statistics_cached,
+    get_metadata_cached,
+    file_mtime,
+    clear_article_caches,
+)
 
 
 def show_settings_page(db):
@@ -36,13 +41,33 @@ def show_settings_page(db):
         show_statistics_section(db)
 
 
+@st.cache_resource
+def _get_scrape_executor():
+    """Worker tunggal untuk job scraping (satu job pada satu waktu)"""
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def _make_scraper(time_window: str):
+    """
+    Lazy import + buat scraper baru
+
+    Import scraper (requests, feedparser, dst.) hanya dibayar saat user
+    benar-benar menjalankan scraping, bukan di setiap load halaman.
+    Instance sengaja tidak di-cache karena statistik run menempel di
+    instance.
+    """
+    from scraper.google_news_scraper import GoogleNewsScraper
+
+    return GoogleNewsScraper(time_window=time_window)
+
+
 def show_scraping_section(db):
     """Scraping management section"""
-    
+
     st.subheader("🔄 Manual Scraping")
     
-    # Last scrape info
-    metadata = db.get_metadata()
+    # Last scrape info (cached per mtime file metadata)
+    metadata = get_metadata_cached(db, file_mtime(db.metadata_path))
     if metadata:
         last_scrape = metadata.get('last_scrape_time', 'Never')
         if last_scrape != 'Never':
@@ -72,44 +97,68 @@ def show_scraping_section(db):
         st.markdown("- Artikel duplikat akan otomatis di-filter")
         
         submit = st.form_submit_button("🚀 Jalankan Scraping", type="primary", width='stretch')
-        
+
         if submit:
-            with st.spinner("🔄 Sedang scraping... Mohon tunggu..."):
-                try:
-                    # Run scraper
-                    scraper = GoogleNewsScraper(time_window=time_window)
-                    result = scraper.run()
-                    
-                    if result["status"] == "SUCCESS":
-                        st.success(f"✅ Scraping berhasil!")
-                        
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.metric("Total Artikel", result["articles_total"])
-                        with col2:
-                            st.metric("Artikel Baru", result["articles_new"])
-                        
-                        # Show statistics
-                        stats = result.get("statistics", {})
-                        with st.expander("📊 Detail Statistics"):
-                            st.json(stats)
-                        
-                        st.balloons()
-                    
-                    elif result["status"] == "NO_DATA":
-                        st.warning("⚠️ Tidak ada artikel yang ditemukan.")
-                        st.info("Ini bisa normal jika tidak ada berita bencana dalam rentang waktu yang dipilih.")
-                    
-                    elif result["status"] == "NO_ARTICLES_AFTER_FILTER":
-                        st.warning("⚠️ Artikel ditemukan tetapi tidak ada yang lolos filter.")
-                        st.info("Coba perluas time window atau periksa konfigurasi filter.")
-                    
-                    else:
-                        st.error(f"❌ Scraping gagal: {result.get('error', 'Unknown error')}")
-                
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
-                    st.exception(e)
+            running = st.session_state.get("scrape_future")
+            if running is not None and not running.done():
+                st.warning("⚠️ Scraping masih berjalan. Mohon tunggu.")
+            else:
+                # Jalankan di background thread supaya script worker
+                # Streamlit tidak ke-block 2-5 menit
+                scraper = _make_scraper(time_window)
+                st.session_state["scrape_future"] = _get_scrape_executor().submit(
+                    scraper.run
+                )
+
+    # Poll job scraping yang sedang berjalan / baru selesai
+    future = st.session_state.get("scrape_future")
+    if future is None:
+        return
+
+    if not future.done():
+        st.status("🔄 Sedang scraping... Mohon tunggu...", state="running")
+        time.sleep(2)
+        st.rerun()
+        return
+
+    st.session_state.pop("scrape_future", None)
+
+    try:
+        result = future.result()
+
+        if result["status"] == "SUCCESS":
+            # Data berubah, invalidate cache articles
+            clear_article_caches()
+
+            st.success(f"✅ Scraping berhasil!")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total Artikel", result["articles_total"])
+            with col2:
+                st.metric("Artikel Baru", result["articles_new"])
+
+            # Show statistics
+            stats = result.get("statistics", {})
+            with st.expander("📊 Detail Statistics"):
+                st.json(stats)
+
+            st.balloons()
+
+        elif result["status"] == "NO_DATA":
+            st.warning("⚠️ Tidak ada artikel yang ditemukan.")
+            st.info("Ini bisa normal jika tidak ada berita bencana dalam rentang waktu yang dipilih.")
+
+        elif result["status"] == "NO_ARTICLES_AFTER_FILTER":
+            st.warning("⚠️ Artikel ditemukan tetapi tidak ada yang lolos filter.")
+            st.info("Coba perluas time window atau periksa konfigurasi filter.")
+
+        else:
+            st.error(f"❌ Scraping gagal: {result.get('error', 'Unknown error')}")
+
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+        st.exception(e)
 
 
 def show_export_section(db):
@@ -136,6 +185,11 @@ def show_export_section(db):
             value=f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         )
     
+    save_copy = st.checkbox(
+        "Simpan salinan ke data/exports (untuk audit)",
+        value=False
+    )
+
     # Tombol biasa, bukan form
     if st.button("💾 Export ke Excel", type="primary"):
         # Map filter selection to status
@@ -145,33 +199,32 @@ def show_export_section(db):
             "Hanya Verified (Bukan)": "VERIFIED_FALSE",
             "Hanya Unverified": "UNVERIFIED"
         }
-        
+
         filter_status = filter_map[export_filter]
-        
-        # Buat folder export kalau belum ada
-        export_dir = "data/exports"
-        os.makedirs(export_dir, exist_ok=True)
-        export_path = os.path.join(export_dir, filename)
-        
-        success = db.export_to_excel(export_path, filter_status)
-        
+
+        # Tulis langsung ke memory, tanpa round-trip ke disk
+        buffer = io.BytesIO()
+        success = db.export_to_excel(buffer, filter_status)
+
         if success:
             st.success("✅ Export berhasil!")
-            
-            # Baca file dan jadikan bytes untuk download_button
-            try:
-                with open(export_path, "rb") as f:
-                    file_bytes = f.read()
-                
-                st.download_button(
-                    label="📥 Download File",
-                    data=file_bytes,
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    key=f"download_{filename}",  # key unik
-                )
-            except Exception as e:
-                st.error(f"❌ Gagal menyiapkan file untuk di-download: {e}")
+
+            file_bytes = buffer.getvalue()
+
+            if save_copy:
+                # Buat folder export kalau belum ada
+                export_dir = "data/exports"
+                os.makedirs(export_dir, exist_ok=True)
+                with open(os.path.join(export_dir, filename), "wb") as f:
+                    f.write(file_bytes)
+
+            st.download_button(
+                label="📥 Download File",
+                data=file_bytes,
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key=f"download_{filename}",  # key unik
+            )
         else:
             st.error("❌ Export gagal. Pastikan ada data untuk di-export.")
 
@@ -187,20 +240,24 @@ def show_delete_section(db):
         return
     
     st.markdown("**⚠️ Perhatian:** Penghapusan bersifat soft-delete (artikel akan di-mark sebagai deleted)")
-    
-    # Load all articles
-    df = db.load_articles()
-    
-    if df.empty:
+
+    # Load hanya kolom yang dipakai tabel delete (cached, keyed on
+    # mtime); filter soft-deleted didorong ke reader, index artikel
+    # asli tetap terjaga lewat _row_id di mirror
+    df_active = load_articles_cached(
+        db,
+        file_mtime(db.csv_path),
+        columns=(
+            'tanggal_wib', 'waktu_wib', 'judul', 'lokasi_kejadian',
+            'jenis_bencana', 'status_verifikasi', 'is_deleted',
+        ),
+        drop_deleted=True,
+    )
+
+    if df_active.empty:
         st.info("Tidak ada artikel dalam database")
         return
-    
-    # Filter non-deleted
-    if 'is_deleted' in df.columns:
-        df_active = df[~df['is_deleted']]
-    else:
-        df_active = df
-    
+
     df_active = df_active.reset_index(drop=False)
     
     # Display table
@@ -234,15 +291,18 @@ def show_delete_section(db):
             else:
                 try:
                     indices = [int(idx.strip()) for idx in article_indices.split(',')]
-                    
-                    success_count = 0
-                    for idx in indices:
-                        if 0 <= idx < len(df_active):
-                            original_index = df_active.iloc[idx]['index']
-                            if db.delete_article(original_index):
-                                success_count += 1
-                    
+
+                    # Satu lookup array, bukan .iloc[idx]['index'] yang
+                    # membangun Series per baris
+                    index_col = df_active['index'].to_numpy()
+                    valid = [idx for idx in indices if 0 <= idx < len(index_col)]
+
+                    # Satu kali rewrite CSV untuk semua artikel sekaligus
+                    success_count = db.delete_articles(index_col[valid].tolist())
+
                     if success_count > 0:
+                        # Data berubah, invalidate cache articles
+                        clear_article_caches()
                         st.success(f"✅ Berhasil menghapus {success_count} artikel")
                         st.rerun()
                     else:
@@ -252,19 +312,28 @@ def show_delete_section(db):
                     st.error("❌ Format index tidak valid")
 
 
+@st.fragment
 def show_statistics_section(db):
-    """Detailed statistics section"""
+    """Detailed statistics section
+
+    Fragment: rerun-nya terisolasi dari navigasi/sidebar
+    """
     
     st.subheader("📊 Detailed Statistics")
-    
-    df = db.load_articles()
+
+    # Hanya kolom yang dipakai chart distribusi/sumber/verifikator
+    df = load_articles_cached(
+        db,
+        file_mtime(db.csv_path),
+        columns=('jenis_bencana', 'lokasi_kejadian', 'sumber', 'verified_by'),
+    )
     
     if df.empty:
         st.info("Tidak ada data untuk ditampilkan")
         return
     
-    # Overall stats
-    stats = db.get_statistics()
+    # Overall stats (cached per mtime CSV)
+    stats = get_statistics_cached(db, file_mtime(db.csv_path))
     
     col1, col2, col3 = st.columns(3)
     
@@ -5,37 +5,67 @@ Verification page - Main interface untuk verifikasi artikel
 import streamlit as st
 import pandas as pd
 
+from app.ui.data_cache import load_unverified_cached, file_mtime
+
 
 def show_verification_page(db):
     """Display verification interface"""
-    
+
     st.markdown('<div class="main-header">✅ Verifikasi Artikel</div>', unsafe_allow_html=True)
     st.markdown("---")
-    
-    # Load unverified articles
-    df_unverified = db.get_unverified_articles()
-    
+
+    # Load unverified articles, cached per mtime CSV + log pending
+    # (soft-deleted sudah difilter di db layer); rerun karena ketikan
+    # di textarea jadi cache hit, bukan re-parse CSV
+    df_unverified = load_unverified_cached(
+        db, file_mtime(db.csv_path), file_mtime(db.pending_log)
+    )
+
     if df_unverified.empty:
+        # Antrian bisa kosong karena klik verifikasi terakhir —
+        # flush di sini supaya log pending langsung masuk CSV dan
+        # dashboard/statistik (yang cuma baca CSV) ikut ter-update
+        if db.pending_count() > 0:
+            flushed = db.flush_pending()
+            st.success(f"✅ {flushed} verifikasi tersimpan")
+
         st.success("🎉 Semua artikel sudah diverifikasi!")
         st.info("Kembali ke Dashboard atau jalankan scraping baru untuk mendapatkan artikel baru.")
         return
-    
-    # Filter deleted articles
-    if 'is_deleted' in df_unverified.columns:
-        df_unverified = df_unverified[~df_unverified['is_deleted']]
-    
-    # Sort by datetime (newest first)
-    if 'datetime_wib' in df_unverified.columns:
-        df_unverified['datetime_wib'] = pd.to_datetime(df_unverified['datetime_wib'], errors='coerce')
-        df_unverified = df_unverified.sort_values('datetime_wib', ascending=False)
+
+    # Sort by datetime (newest first) — urutan dihitung sekali per
+    # versi data dan disimpan di session_state; rerun berikutnya cuma
+    # reindex, bukan sort O(N log N) lagi
+    sort_key = (file_mtime(db.csv_path), file_mtime(db.pending_log))
+    if (
+        st.session_state.get('unverified_sort_key') != sort_key
+        or 'unverified_sorted_ids' not in st.session_state
+    ):
+        if 'datetime_wib' in df_unverified.columns:
+            order = df_unverified.sort_values('datetime_wib', ascending=False).index
+        else:
+            order = df_unverified.index
+        st.session_state['unverified_sorted_ids'] = order.tolist()
+        st.session_state['unverified_sort_key'] = sort_key
+
+    df_unverified = df_unverified.loc[st.session_state['unverified_sorted_ids']]
     
     df_unverified = df_unverified.reset_index(drop=False)  # Keep original index
     
     # Statistics
     col1, col2 = st.columns([3, 1])
-    
+
     with col1:
         st.info(f"**📝 Total artikel yang perlu diverifikasi: {len(df_unverified)}**")
+
+        # Verifikasi per klik masuk ke log pending (append O(1));
+        # tombol ini yang menulis semuanya ke CSV dalam satu write
+        pending = db.pending_count()
+        if pending > 0:
+            if st.button(f"💾 Simpan {pending} verifikasi ke database"):
+                flushed = db.flush_pending()
+                st.success(f"✅ {flushed} verifikasi tersimpan")
+                st.rerun()
     
     with col2:
         view_mode = st.selectbox(
@@ -53,18 +83,57 @@ def show_verification_page(db):
         show_table_verification(db, df_unverified)
 
 
+def _verify_current(db, original_index, is_bencana, notes_key):
+    """
+    Callback klik BENCANA/BUKAN
+
+    Satu append ke log pending; antrian menyusut sendiri di rerun
+    implisit berikutnya (mtime log berubah), jadi index tidak perlu
+    digeser dan tidak ada st.rerun eksplisit
+    """
+    username = st.session_state.get('username', 'Unknown')
+    notes = st.session_state.get(notes_key, '')
+
+    if db.update_verification(original_index, is_bencana, username, notes):
+        st.session_state['_verify_flash'] = (
+            'VERIFIED_TRUE' if is_bencana else 'VERIFIED_FALSE'
+        )
+        # Kosongkan catatan yang sudah terpakai (legal di dalam
+        # on_click, sebelum render berikutnya)
+        if notes_key in st.session_state:
+            st.session_state[notes_key] = ''
+    else:
+        st.session_state['_verify_flash'] = 'ERROR'
+
+
+def _goto_article(idx):
+    """Callback navigasi antar artikel"""
+    st.session_state['current_article_idx'] = idx
+
+
 def show_one_by_one_verification(db, df_unverified):
     """One-by-one verification mode (Tinder-style)"""
-    
+
     # Article selector
     if 'current_article_idx' not in st.session_state:
         st.session_state['current_article_idx'] = 0
-    
+
     current_idx = st.session_state['current_article_idx']
+
+    # Flash hasil klik sebelumnya (di-set oleh callback)
+    flash = st.session_state.pop('_verify_flash', None)
+    if flash == 'VERIFIED_TRUE':
+        st.success("✅ Artikel diverifikasi sebagai BENCANA")
+    elif flash == 'VERIFIED_FALSE':
+        st.info("ℹ️ Artikel diverifikasi sebagai BUKAN BENCANA")
+    elif flash == 'ERROR':
+        st.error("❌ Gagal menyimpan verifikasi")
     
     # Check if we have articles
     if current_idx >= len(df_unverified):
         st.success("✅ Semua artikel telah diverifikasi!")
+        # Flush otomatis di akhir sesi verifikasi
+        db.flush_pending()
         st.session_state['current_article_idx'] = 0
         return
     
@@ -116,80 +185,74 @@ def show_one_by_one_verification(db, df_unverified):
     # Verification form
     st.markdown("### 🎯 Verifikasi")
     
-    with st.form(f"verify_form_{current_idx}"):
-        col1, col2, col3 = st.columns([1, 1, 2])
-        
-        with col1:
-            is_disaster = st.form_submit_button(
-                "✅ BENCANA",
-                width='stretch',
-                type="primary"
-            )
-        
-        with col2:
-            not_disaster = st.form_submit_button(
-                "❌ BUKAN",
-                width='stretch',
-                type="secondary"
-            )
-        
-        with col3:
-            skip = st.form_submit_button(
-                "⏭️ Skip",
-                width='stretch'
-            )
-        
-        notes = st.text_area(
-            "Catatan (opsional)",
-            placeholder="Tambahkan catatan jika diperlukan...",
-            key=f"notes_{current_idx}"
+    # Tombol pakai on_click callback: mutasi state terjadi sebelum
+    # rerun implisit Streamlit, tanpa st.rerun() (= satu render per
+    # klik, bukan dua). Key catatan diikat ke artikel (bukan posisi
+    # antrian): setelah verifikasi antrian menyusut tanpa menggeser
+    # current_idx, jadi key posisi akan membawa catatan artikel
+    # sebelumnya ke artikel berikutnya
+    notes_key = f"notes_{original_index}"
+
+    col1, col2, col3 = st.columns([1, 1, 2])
+
+    with col1:
+        st.button(
+            "✅ BENCANA",
+            width='stretch',
+            type="primary",
+            on_click=_verify_current,
+            args=(db, original_index, True, notes_key),
         )
-        
-        # Handle submission
-        if is_disaster or not_disaster:
-            username = st.session_state.get('username', 'Unknown')
-            success = db.update_verification(
-                original_index,
-                is_disaster,
-                username,
-                notes
-            )
-            
-            if success:
-                if is_disaster:
-                    st.success("✅ Artikel diverifikasi sebagai BENCANA")
-                else:
-                    st.info("ℹ️ Artikel diverifikasi sebagai BUKAN BENCANA")
-                
-                # Move to next article
-                st.session_state['current_article_idx'] += 1
-                st.rerun()
-            else:
-                st.error("❌ Gagal menyimpan verifikasi")
-        
-        if skip:
-            # Move to next article without verifying
-            st.session_state['current_article_idx'] += 1
-            st.rerun()
-    
+
+    with col2:
+        st.button(
+            "❌ BUKAN",
+            width='stretch',
+            type="secondary",
+            on_click=_verify_current,
+            args=(db, original_index, False, notes_key),
+        )
+
+    with col3:
+        st.button(
+            "⏭️ Skip",
+            width='stretch',
+            on_click=_goto_article,
+            args=(current_idx + 1,),
+        )
+
+    st.text_area(
+        "Catatan (opsional)",
+        placeholder="Tambahkan catatan jika diperlukan...",
+        key=notes_key
+    )
+
     # Navigation buttons
     st.markdown("---")
     col1, col2, col3 = st.columns([1, 1, 1])
-    
+
     with col1:
-        if st.button("⬅️ Previous", disabled=(current_idx == 0)):
-            st.session_state['current_article_idx'] = max(0, current_idx - 1)
-            st.rerun()
-    
+        st.button(
+            "⬅️ Previous",
+            disabled=(current_idx == 0),
+            on_click=_goto_article,
+            args=(max(0, current_idx - 1),),
+        )
+
     with col2:
-        if st.button("🔄 Reset to First"):
-            st.session_state['current_article_idx'] = 0
-            st.rerun()
-    
+        st.button(
+            "🔄 Reset to First",
+            on_click=_goto_article,
+            args=(0,),
+        )
+
     with col3:
-        if st.button("➡️ Next", disabled=(current_idx >= len(df_unverified) - 1)):
-            st.session_state['current_article_idx'] = min(len(df_unverified) - 1, current_idx + 1)
-            st.rerun()
+        st.button(
+            "➡️ Next",
+            disabled=(current_idx >= len(df_unverified) - 1),
+            on_click=_goto_article,
+            args=(min(len(df_unverified) - 1, current_idx + 1),),
+        )
 
 
 def show_table_verification(db, df_unverified):
@@ -252,15 +315,15 @@ def show_table_verification(db, df_unverified):
                 if not original_indices:
                     st.error("❌ Index tidak valid")
                 else:
-                    # Verify each article
+                    # Satu batch update + satu write CSV, bukan
+                    # load + rewrite per artikel
                     is_disaster = (action == "Verifikasi sebagai BENCANA")
                     username = st.session_state.get('username', 'Unknown')
-                    
-                    success_count = 0
-                    for orig_idx in original_indices:
-                        if db.update_verification(orig_idx, is_disaster, username, notes):
-                            success_count += 1
-                    
+
+                    success_count = db.update_verification_batch(
+                        original_indices, is_disaster, username, notes
+                    )
+
                     if success_count == len(original_indices):
                         st.success(f"✅ Berhasil verifikasi {success_count} artikel")
                         st.rerun()
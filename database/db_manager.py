@@ -5,16 +5,39 @@ Bisa di-migrate ke SQLite nanti dengan mudah
 
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import json
 
 import pandas as pd
+import pyarrow.parquet as pq
+from openpyxl import Workbook
 
 
 # BASE_DIR = folder root project (bukan folder /database)
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 
+# Di atas jumlah baris ini, export Excel pakai mode streaming
+# (write-only) supaya workbook tidak menahan semua baris di memory
+EXCEL_STREAM_THRESHOLD = 5000
+
+# Cache hasil parse CSV per proses, keyed (path, mtime). Level UI sudah
+# punya st.cache_data; cache ini melindungi pemakai non-Streamlit
+# (scripts, scraper) dan call berulang dalam satu rerun
+_LOAD_CACHE: Dict = {}
+
+# Dtype kolom string yang sudah diketahui, supaya read_csv
+# tidak perlu pass inferensi tipe per kolom
+CSV_DTYPES = {
+    "judul": "string",
+    "link": "string",
+    "ringkasan": "string",
+    "sumber": "string",
+    "kata_kunci": "string",
+    "domain": "string",
+    "judul_bersih": "string",
+}
+
 
 class CSVDatabase:
     """CSV-based database manager"""
@@ -30,31 +53,217 @@ class CSVDatabase:
 
         self.metadata_path = DATA_DIR / "metadata.json"
 
+        # Mirror Parquet untuk read cepat (columnar). CSV tetap jadi
+        # file utama karena scraper dan export masih berbasis CSV.
+        self.parquet_path = self.csv_path.with_suffix(".parquet")
+
+        # Log append-only untuk verifikasi pending; satu klik = satu
+        # append O(1), bukan rewrite seluruh CSV. Di-merge ke CSV oleh
+        # flush_pending()
+        self.pending_log = self.csv_path.parent / "verifications.jsonl"
+
     def load_articles(self, reload: bool = False) -> pd.DataFrame:
         """
         Load articles from CSV
 
+        Hasil parse di-cache per (path, mtime) dan dikembalikan TANPA
+        copy — reader memperlakukannya read-only; mutator (flush,
+        delete, batch update) yang bayar .copy() di tempat mutasi
+
         Args:
-            reload: Force reload from disk (disiapkan kalau nanti pakai cache)
+            reload: Force reload from disk (skip cache)
 
         Returns:
-            DataFrame of articles
+            DataFrame of articles (shared, jangan dimutasi)
         """
         if not self.csv_path.exists():
             return pd.DataFrame()
 
+        cache_key = (str(self.csv_path), self.csv_path.stat().st_mtime)
+        if not reload:
+            cached = _LOAD_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            df = pd.read_csv(self.csv_path)
+            try:
+                # Arrow CSV reader: multithreaded, dan dtype eksplisit
+                # melewati pass inferensi tipe pandas
+                df = pd.read_csv(
+                    self.csv_path,
+                    engine="pyarrow",
+                    dtype=CSV_DTYPES,
+                    parse_dates=["datetime_wib"],
+                )
+            except (ValueError, TypeError, ImportError):
+                # Fallback ke C engine (mis. kolom belum lengkap)
+                df = pd.read_csv(self.csv_path)
 
             # Ensure datetime columns
             if "datetime_wib" in df.columns:
-                df["datetime_wib"] = pd.to_datetime(df["datetime_wib"], errors="coerce")
+                if not pd.api.types.is_datetime64_any_dtype(df["datetime_wib"]):
+                    df["datetime_wib"] = pd.to_datetime(
+                        df["datetime_wib"], errors="coerce"
+                    )
+                # Arrow memparse offset +07:00 sebagai UTC; kembalikan
+                # ke WIB supaya .dt.date dkk tetap tanggal lokal
+                if getattr(df["datetime_wib"].dtype, "tz", None) is not None:
+                    df["datetime_wib"] = df["datetime_wib"].dt.tz_convert(
+                        "Asia/Jakarta"
+                    )
+
+            # Kolom low-cardinality sebagai category: value_counts dan
+            # perbandingan == jalan di integer codes, memory jauh lebih kecil
+            for col in ("jenis_bencana", "lokasi_kejadian", "sumber",
+                        "domain", "status_verifikasi"):
+                if col in df.columns:
+                    df[col] = df[col].astype("category")
+
+            # is_deleted sebagai bool murni (NaN = belum dihapus),
+            # supaya mask ~is_deleted tidak jatuh ke object dtype
+            if "is_deleted" in df.columns:
+                df["is_deleted"] = df["is_deleted"].fillna(False).astype(bool)
+
+            # Kolom verifikasi diberi dtype eksplisit sekali di sini,
+            # supaya update tidak men-thrash dtype (float64 <-> object)
+            # di setiap siklus load/save
+            self._ensure_verification_columns(df)
+
+            # Semua status yang valid harus terdaftar sebagai category,
+            # supaya update_verification bisa assign nilai baru
+            if "status_verifikasi" in df.columns:
+                missing = [
+                    s
+                    for s in ("UNVERIFIED", "VERIFIED_TRUE", "VERIFIED_FALSE")
+                    if s not in df["status_verifikasi"].cat.categories
+                ]
+                if missing:
+                    df["status_verifikasi"] = df[
+                        "status_verifikasi"
+                    ].cat.add_categories(missing)
+
+            # Simpan di cache; entry lama (mtime beda) dibuang
+            _LOAD_CACHE.clear()
+            _LOAD_CACHE[cache_key] = df
 
             return df
         except Exception as e:
             print(f"Error loading CSV: {e}")
             return pd.DataFrame()
 
+    def _write_parquet_mirror(self, df: pd.DataFrame) -> None:
+        """
+        Tulis mirror Parquet dari frame yang sudah di-load
+
+        Args:
+            df: DataFrame articles (tidak dimodifikasi)
+        """
+        df = df.copy()
+
+        # Normalisasi is_deleted supaya bisa dipakai sebagai
+        # filter pushdown (boolean, tanpa NaN)
+        if "is_deleted" in df.columns:
+            df["is_deleted"] = df["is_deleted"].fillna(False).astype(bool)
+
+        # Materialisasi index baris sebagai kolom: read dengan filter
+        # pushdown tetap mengembalikan index artikel asli (padanan
+        # rowid di database beneran)
+        df["_row_id"] = range(len(df))
+
+        df.to_parquet(
+            self.parquet_path, engine="pyarrow", compression="snappy", index=False
+        )
+
+    def _refresh_parquet(self) -> bool:
+        """
+        Pastikan mirror Parquet up-to-date terhadap CSV
+
+        Returns:
+            True jika mirror Parquet tersedia dan fresh
+        """
+        if not self.csv_path.exists():
+            return False
+
+        try:
+            if (
+                not self.parquet_path.exists()
+                or self.parquet_path.stat().st_mtime < self.csv_path.stat().st_mtime
+            ):
+                self._write_parquet_mirror(self.load_articles())
+
+            return True
+        except Exception as e:
+            print(f"Error refreshing parquet mirror: {e}")
+            return False
+
+    def load_articles_parquet(
+        self,
+        columns: Optional[List[str]] = None,
+        drop_deleted: bool = False,
+        filters: Optional[List[tuple]] = None,
+    ) -> pd.DataFrame:
+        """
+        Load articles lewat mirror Parquet (column projection +
+        predicate pushdown), fallback ke CSV kalau mirror gagal
+
+        Args:
+            columns: Subset kolom yang dibutuhkan (None = semua)
+            drop_deleted: Buang artikel soft-deleted di level reader
+            filters: Predicate tambahan sebagai (kolom, "==", nilai),
+                     dievaluasi di level reader (pushdown)
+
+        Returns:
+            DataFrame of articles
+        """
+        if self._refresh_parquet():
+            try:
+                available = pq.read_schema(self.parquet_path).names
+
+                use_cols = None
+                if columns is not None:
+                    use_cols = [c for c in columns if c in available]
+                    if "_row_id" in available:
+                        use_cols.append("_row_id")
+
+                pq_filters = list(filters) if filters else []
+                if drop_deleted and "is_deleted" in available:
+                    pq_filters.append(("is_deleted", "==", False))
+                pq_filters = [f for f in pq_filters if f[0] in available] or None
+
+                df = pd.read_parquet(
+                    self.parquet_path,
+                    engine="pyarrow",
+                    columns=use_cols,
+                    filters=pq_filters,
+                )
+
+                # Kembalikan index artikel asli dari kolom _row_id,
+                # supaya hasil read terfilter tetap bisa dipakai untuk
+                # update/delete by index
+                if "_row_id" in df.columns:
+                    df = df.set_index("_row_id")
+                    df.index.name = None
+
+                return df
+            except Exception as e:
+                print(f"Error loading parquet mirror: {e}")
+
+        # Fallback: CSV penuh + filter manual
+        df = self.load_articles()
+
+        if drop_deleted and "is_deleted" in df.columns:
+            df = df[df["is_deleted"].fillna(False) != True]  # noqa: E712
+
+        if filters and not df.empty:
+            for col, op, value in filters:
+                if col in df.columns and op == "==":
+                    df = df[df[col] == value]
+
+        if columns is not None and not df.empty:
+            df = df[[c for c in columns if c in df.columns]]
+
+        return df
+
     def save_articles(self, df: pd.DataFrame) -> bool:
         """
         Save articles to CSV
@@ -68,6 +277,18 @@ class CSVDatabase:
         try:
             self.csv_path.parent.mkdir(parents=True, exist_ok=True)
             df.to_csv(self.csv_path, index=False, encoding="utf-8-sig")
+
+            # Isi file berubah — invalidate cache load
+            _LOAD_CACHE.clear()
+
+            # Tulis mirror dari frame in-memory, supaya read berikutnya
+            # tidak perlu re-parse CSV untuk refresh mirror
+            try:
+                self._write_parquet_mirror(df.reset_index(drop=True))
+            except Exception as e:
+                # Mirror gagal tidak fatal: refresh lazy akan mencoba lagi
+                print(f"Error writing parquet mirror: {e}")
+
             return True
         except Exception as e:
             print(f"Error saving CSV: {e}")
@@ -83,15 +304,28 @@ class CSVDatabase:
         Returns:
             Filtered DataFrame
         """
-        df = self.load_articles()
+        # Filter tanggal didorong ke reader (predicate pushdown di
+        # mirror Parquet), bukan load semua baris lalu filter
+        df = self.load_articles_parquet(
+            filters=[("tanggal_wib", "==", date_str)]
+        )
 
         if df.empty or "tanggal_wib" not in df.columns:
             return pd.DataFrame()
 
-        return df[df["tanggal_wib"] == date_str].copy()
+        return df
 
-    def get_unverified_articles(self) -> pd.DataFrame:
-        """Get articles that haven't been verified"""
+    def get_unverified_articles(self, include_deleted: bool = False) -> pd.DataFrame:
+        """
+        Get articles that haven't been verified
+
+        Args:
+            include_deleted: Ikutkan juga artikel yang soft-deleted
+
+        Returns:
+            View (tanpa .copy) artikel UNVERIFIED; caller yang mau
+            mutate harus copy sendiri
+        """
         df = self.load_articles()
 
         if df.empty:
@@ -101,7 +335,18 @@ class CSVDatabase:
         if "status_verifikasi" not in df.columns:
             df["status_verifikasi"] = "UNVERIFIED"
 
-        return df[df["status_verifikasi"] == "UNVERIFIED"].copy()
+        # Satu combined mask, satu pass filter
+        mask = (df["status_verifikasi"] == "UNVERIFIED").to_numpy()
+        if not include_deleted and "is_deleted" in df.columns:
+            mask = mask & ~df["is_deleted"].fillna(False).to_numpy(dtype=bool)
+
+        # Overlay log pending: artikel yang sudah diverifikasi tapi
+        # belum di-flush ke CSV tidak dimunculkan lagi
+        pending = self._read_pending()
+        if pending:
+            mask = mask & ~df.index.isin(list(pending))
+
+        return df.loc[mask]
 
     def get_verified_articles(self, status: Optional[str] = None) -> pd.DataFrame:
         """
@@ -115,10 +360,11 @@ class CSVDatabase:
         if df.empty or "status_verifikasi" not in df.columns:
             return pd.DataFrame()
 
+        # View tanpa .copy — caller memperlakukannya read-only
         if status:
-            return df[df["status_verifikasi"] == status].copy()
+            return df[df["status_verifikasi"] == status]
         else:
-            return df[df["status_verifikasi"] != "UNVERIFIED"].copy()
+            return df[df["status_verifikasi"] != "UNVERIFIED"]
 
     def update_verification(
         self, index: int, is_bencana: bool, username: str, notes: str = ""
@@ -140,27 +386,191 @@ class CSVDatabase:
         if df.empty or index not in df.index:
             return False
 
-        # Add columns if not exist
+        # Satu klik verifikasi = satu append ke log JSONL (O(1)),
+        # bukan load + rewrite seluruh CSV (O(filesize)). Merge ke CSV
+        # dilakukan sekali oleh flush_pending()
+        record = {
+            "index": int(index),
+            "is_bencana": bool(is_bencana),
+            "user": username,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "notes": notes,
+        }
+
+        try:
+            with open(self.pending_log, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return True
+        except Exception as e:
+            print(f"Error writing verification log: {e}")
+            return False
+
+    def _read_pending(self) -> Dict[int, dict]:
+        """
+        Baca log verifikasi pending
+
+        Returns:
+            Dict index -> record terakhir untuk index tersebut
+        """
+        records: Dict[int, dict] = {}
+
+        if not self.pending_log.exists():
+            return records
+
+        try:
+            with open(self.pending_log, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = json.loads(line)
+                        records[int(rec["index"])] = rec
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                        # Baris korup di-skip, sisanya tetap diproses
+                        continue
+        except Exception as e:
+            print(f"Error reading verification log: {e}")
+
+        return records
+
+    def pending_count(self) -> int:
+        """Jumlah verifikasi pending yang belum di-flush ke CSV"""
+        return len(self._read_pending())
+
+    def flush_pending(self) -> int:
+        """
+        Merge semua verifikasi pending ke CSV dalam satu write
+
+        Dipanggil saat startup aplikasi dan dari tombol Save di halaman
+        verifikasi. Update diaplikasikan sebagai satu assignment
+        vectorized per kolom, lalu log di-truncate.
+
+        Returns:
+            Jumlah artikel yang berhasil di-update
+        """
+        records = self._read_pending()
+        if not records:
+            return 0
+
+        # Copy di tempat mutasi: load_articles mengembalikan frame
+        # shared dari cache
+        df = self.load_articles().copy()
+        valid = [idx for idx in records if idx in df.index] if not df.empty else []
+
+        if not valid:
+            self.pending_log.unlink(missing_ok=True)
+            return 0
+
+        self._ensure_verification_columns(df)
+
+        # Satu assignment vectorized per kolom untuk semua update
+        recs = [records[idx] for idx in valid]
+        df.loc[valid, "status_verifikasi"] = [
+            "VERIFIED_TRUE" if r["is_bencana"] else "VERIFIED_FALSE" for r in recs
+        ]
+        df.loc[valid, "is_bencana"] = [r["is_bencana"] for r in recs]
+        df.loc[valid, "verified_by"] = [r.get("user", "Unknown") for r in recs]
+        df.loc[valid, "verified_at"] = pd.to_datetime(
+            [r.get("ts") for r in recs], errors="coerce", utc=True
+        )
+        df.loc[valid, "notes"] = [r.get("notes", "") for r in recs]
+
+        if not self.save_articles(df):
+            return 0
+
+        self.pending_log.unlink(missing_ok=True)
+        return len(valid)
+
+    @staticmethod
+    def _ensure_verification_columns(df: pd.DataFrame) -> None:
+        """
+        Pastikan kolom verifikasi ada dengan dtype eksplisit (in-place)
+
+        Dtype ditetapkan sekali di sini (nullable boolean/string,
+        datetime UTC, categorical) supaya siklus load/update/save tidak
+        bolak-balik antara float64 (kolom kosong) dan object
+        """
         if "status_verifikasi" not in df.columns:
-            df["status_verifikasi"] = "UNVERIFIED"
+            df["status_verifikasi"] = pd.Categorical(
+                ["UNVERIFIED"] * len(df),
+                categories=["UNVERIFIED", "VERIFIED_TRUE", "VERIFIED_FALSE"],
+            )
         if "is_bencana" not in df.columns:
-            df["is_bencana"] = None
+            df["is_bencana"] = pd.Series(pd.NA, index=df.index, dtype="boolean")
         if "verified_by" not in df.columns:
-            df["verified_by"] = None
+            df["verified_by"] = pd.Series(pd.NA, index=df.index, dtype="string")
         if "verified_at" not in df.columns:
-            df["verified_at"] = None
+            df["verified_at"] = pd.Series(
+                pd.NaT, index=df.index, dtype="datetime64[ns, UTC]"
+            )
         if "notes" not in df.columns:
-            df["notes"] = ""
+            df["notes"] = pd.Series(pd.NA, index=df.index, dtype="string")
+
+        # Kolom lama (CSV) bisa ke-load sebagai float64 (semua NaN)
+        # atau object; normalisasi ke dtype target
+        if not pd.api.types.is_bool_dtype(df["is_bencana"]):
+            df["is_bencana"] = df["is_bencana"].astype("boolean")
+        for col in ("verified_by", "notes"):
+            if not pd.api.types.is_string_dtype(df[col]):
+                df[col] = df[col].astype("string")
+        if not pd.api.types.is_datetime64_any_dtype(df["verified_at"]):
+            df["verified_at"] = pd.to_datetime(
+                df["verified_at"], errors="coerce", utc=True
+            )
+
+        # Defensif: daftarkan status baru di categorical sebelum assign
+        status_col = df["status_verifikasi"]
+        if isinstance(status_col.dtype, pd.CategoricalDtype):
+            missing = [
+                s
+                for s in ("VERIFIED_TRUE", "VERIFIED_FALSE")
+                if s not in status_col.cat.categories
+            ]
+            if missing:
+                df["status_verifikasi"] = status_col.cat.add_categories(missing)
+
+    def update_verification_batch(
+        self, indices: List[int], is_bencana: bool, username: str, notes: str = ""
+    ) -> int:
+        """
+        Verifikasi beberapa artikel sekaligus dengan satu write
+
+        Satu broadcast df.loc untuk semua baris, satu save — bukan
+        load + rewrite CSV per artikel seperti loop update_verification.
+
+        Args:
+            indices: List DataFrame index
+            is_bencana: True jika diverifikasi sebagai bencana
+            username: Username yang memverifikasi
+            notes: Catatan opsional (sama untuk semua artikel)
+
+        Returns:
+            Jumlah artikel yang berhasil di-update
+        """
+        # Copy di tempat mutasi: frame dari cache bersifat shared
+        df = self.load_articles().copy()
+
+        if df.empty:
+            return 0
+
+        valid = [idx for idx in indices if idx in df.index]
+        if not valid:
+            return 0
+
+        self._ensure_verification_columns(df)
 
-        # Update values
         status = "VERIFIED_TRUE" if is_bencana else "VERIFIED_FALSE"
-        df.at[index, "status_verifikasi"] = status
-        df.at[index, "is_bencana"] = is_bencana
-        df.at[index, "verified_by"] = username
-        df.at[index, "verified_at"] = datetime.now(timezone.utc).isoformat()
-        df.at[index, "notes"] = notes
+        df.loc[valid, "status_verifikasi"] = status
+        df.loc[valid, "is_bencana"] = is_bencana
+        df.loc[valid, "verified_by"] = username
+        df.loc[valid, "verified_at"] = pd.Timestamp.now(tz="UTC")
+        df.loc[valid, "notes"] = notes
 
-        return self.save_articles(df)
+        if not self.save_articles(df):
+            return 0
+
+        return len(valid)
 
     def delete_article(self, index: int) -> bool:
         """
@@ -172,7 +582,8 @@ class CSVDatabase:
         Returns:
             True if successful
         """
-        df = self.load_articles()
+        # Copy di tempat mutasi: frame dari cache bersifat shared
+        df = self.load_articles().copy()
 
         if df.empty or index not in df.index:
             return False
@@ -185,9 +596,45 @@ class CSVDatabase:
 
         return self.save_articles(df)
 
+    def delete_articles(self, indices: List[int]) -> int:
+        """
+        Soft-delete beberapa artikel sekaligus
+
+        Satu kali load + satu kali rewrite CSV, bukan per artikel
+
+        Args:
+            indices: List of DataFrame index
+
+        Returns:
+            Jumlah artikel yang berhasil di-mark deleted
+        """
+        # Copy di tempat mutasi: frame dari cache bersifat shared
+        df = self.load_articles().copy()
+
+        if df.empty:
+            return 0
+
+        # Add is_deleted column if not exist
+        if "is_deleted" not in df.columns:
+            df["is_deleted"] = False
+
+        valid = [idx for idx in indices if idx in df.index]
+        if not valid:
+            return 0
+
+        df.loc[valid, "is_deleted"] = True
+
+        return len(valid) if self.save_articles(df) else 0
+
     def get_statistics(self) -> Dict:
-        """Get database statistics"""
-        df = self.load_articles()
+        """Get database statistics
+
+        Satu pass value_counts atas dua kolom (lewat column projection),
+        bukan empat boolean filter terpisah atas seluruh frame
+        """
+        df = self.load_articles_parquet(
+            columns=["status_verifikasi", "is_deleted"]
+        )
 
         if df.empty:
             return {
@@ -198,32 +645,27 @@ class CSVDatabase:
                 "deleted": 0,
             }
 
-        # Ensure columns exist
-        if "status_verifikasi" not in df.columns:
-            df["status_verifikasi"] = "UNVERIFIED"
-        if "is_deleted" not in df.columns:
-            df["is_deleted"] = False
+        if "is_deleted" in df.columns:
+            deleted_mask = df["is_deleted"].fillna(False).astype(bool)
+        else:
+            deleted_mask = pd.Series(False, index=df.index)
 
-        # Active articles (not deleted)
-        active_df = df[~df["is_deleted"]]
-
-        stats = {
-            "total": len(active_df),
-            "unverified": len(
-                active_df[active_df["status_verifikasi"] == "UNVERIFIED"]
-            ),
-            "verified_true": len(
-                active_df[active_df["status_verifikasi"] == "VERIFIED_TRUE"]
-            ),
-            "verified_false": len(
-                active_df[active_df["status_verifikasi"] == "VERIFIED_FALSE"]
-            ),
-            "deleted": len(df[df["is_deleted"]])
-            if "is_deleted" in df.columns
-            else 0,
-        }
+        n_deleted = int(deleted_mask.sum())
+        n_active = len(df) - n_deleted
 
-        return stats
+        if "status_verifikasi" in df.columns:
+            counts = df.loc[~deleted_mask, "status_verifikasi"].value_counts()
+        else:
+            # Kolom belum ada = semua artikel dianggap unverified
+            counts = pd.Series({"UNVERIFIED": n_active})
+
+        return {
+            "total": n_active,
+            "unverified": int(counts.get("UNVERIFIED", 0)),
+            "verified_true": int(counts.get("VERIFIED_TRUE", 0)),
+            "verified_false": int(counts.get("VERIFIED_FALSE", 0)),
+            "deleted": n_deleted,
+        }
 
     def get_metadata(self) -> Dict:
         """Load scraping metadata"""
@@ -237,12 +679,12 @@ class CSVDatabase:
             print(f"Error loading metadata: {e}")
             return {}
 
-    def export_to_excel(self, output_path: str, filter_status: Optional[str] = None) -> bool:
+    def export_to_excel(self, output, filter_status: Optional[str] = None) -> bool:
         """
         Export articles to Excel
 
         Args:
-            output_path: Output file path
+            output: Output file path, atau file-like object (mis. BytesIO)
             filter_status: Optional status filter
 
         Returns:
@@ -279,13 +721,47 @@ class CSVDatabase:
 
         # Only include columns that exist
         export_columns = [col for col in export_columns if col in df.columns]
-        df_export = df[export_columns]
+        df_export = df[export_columns].copy()
+
+        # Excel tidak mendukung datetime ber-timezone
+        for col in df_export.columns:
+            if isinstance(df_export[col].dtype, pd.DatetimeTZDtype):
+                df_export[col] = df_export[col].dt.tz_localize(None)
 
         try:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            df_export.to_excel(output_path, index=False, engine="openpyxl")
+            if not hasattr(output, "write"):
+                output = Path(output)
+                output.parent.mkdir(parents=True, exist_ok=True)
+
+            if len(df_export) > EXCEL_STREAM_THRESHOLD:
+                # Export besar: stream baris per baris, memory O(1)
+                self._write_excel_streaming(df_export, output)
+            else:
+                # Export kecil: pandas to_excel biasa
+                df_export.to_excel(output, index=False, engine="openpyxl")
             return True
         except Exception as e:
             print(f"Error exporting to Excel: {e}")
             return False
+
+    @staticmethod
+    def _write_excel_streaming(df: pd.DataFrame, output) -> None:
+        """
+        Tulis DataFrame ke Excel dengan openpyxl write-only mode
+
+        Baris di-append satu per satu sehingga workbook tidak pernah
+        menahan seluruh sheet di memory (penting untuk export besar)
+
+        Args:
+            df: DataFrame untuk ditulis
+            output: File path atau file-like object
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+
+        ws.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            # openpyxl menolak NaN/NaT — ganti dengan cell kosong
+            ws.append([None if pd.isna(v) else v for v in row])
+
+        wb.save(output)
@@ -2,8 +2,9 @@
 Konfigurasi untuk scraper berita bencana
 """
 
-# Kata kunci bencana alam
-DISASTER_KEYWORDS = [
+# Kata kunci bencana alam (tuple: immutable, dibagikan antar instance
+# filter tanpa rebind per instance)
+DISASTER_KEYWORDS = (
     "bencana alam",
     "banjir",
     "banjir bandang",
@@ -35,10 +36,10 @@ DISASTER_KEYWORDS = [
     "kecelakaan pesawat",
     "konflik sosial",
     "bentrok warga",
-]
+)
 
 # Kata kunci negatif (untuk filtering false positives)
-NEGATIVE_KEYWORDS = [
+NEGATIVE_KEYWORDS = (
     # Olahraga
     "real madrid", "barcelona", "liga", "serie a", "serie-a", "premier league",
     "bundesliga", "laliga", "liga champions", "liga inggris", "liga spanyol",
@@ -63,15 +64,15 @@ NEGATIVE_KEYWORDS = [
     
     # Judi & Narkoba
     "judol", "judi online", "perjudian", "narkoba", "bandar narkoba",
-]
+)
 
 # Konteks epidemi (untuk validasi berita wabah)
-EPIDEMIC_CONTEXT = [
+EPIDEMIC_CONTEXT = (
     "penyakit", "virus", "bakteri", "epidemi", "endemik", "pandemi",
     "flu", "diare", "dbd", "demam berdarah", "covid", "covid-19",
     "hepatitis", "polio", "rabies", "infeksi", "positif", "kasus",
     "pasien", "rumah sakit", "isolasi", "karantina", "vaksin", "imunisasi",
-]
+)
 
 # Google News Settings
 GOOGLE_NEWS_CONFIG = {
@@ -84,6 +85,7 @@ GOOGLE_NEWS_CONFIG = {
 SCRAPING_CONFIG = {
     "time_window": "1d",           # Default time window
     "timeout": 15,                 # Request timeout in seconds
+    "max_workers": 8,              # Concurrent RSS fetches
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
 }
 
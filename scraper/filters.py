@@ -5,198 +5,434 @@ Fungsi-fungsi filtering untuk berita bencana
 import re
 import json
 import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, List
+
+import numpy as np
+import pandas as pd
 from .config import DISASTER_KEYWORDS, NEGATIVE_KEYWORDS, EPIDEMIC_CONTEXT, FILE_PATHS
 
+# orjson (C) jauh lebih cepat dari json stdlib untuk file lokasi yang
+# besar; fallback ke stdlib kalau tidak terinstall
+try:
+    import orjson
+
+    def _loads_bytes(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    def _loads_bytes(data: bytes):
+        return json.loads(data)
+
+
+def _prep(judul, ringkasan) -> str:
+    """
+    Gabung judul + ringkasan dan lowercase sekali
+
+    Dipakai ulang oleh semua filter supaya string yang sama tidak
+    dialokasikan dan di-lowercase berulang per artikel
+    """
+    if not isinstance(judul, str):
+        judul = ""
+    if not isinstance(ringkasan, str):
+        ringkasan = ""
+    return f"{judul} {ringkasan}".lower()
+
+
+@lru_cache(maxsize=1)
+def _lokasi_keywords_cached() -> tuple:
+    """
+    Load daftar lokasi dari file JSON, sekali per proses
+
+    Semua instance LocationFilter berbagi hasil parse yang sama;
+    tuple supaya immutable dan hashable
+    """
+    lokasi_file = FILE_PATHS["lokasi_config"]
+
+    if os.path.exists(lokasi_file):
+        data = _loads_bytes(Path(lokasi_file).read_bytes())
+        # Gabungkan semua kategori
+        all_locations = (
+            data.get("provinsi", []) +
+            data.get("kota_kabupaten", []) +
+            data.get("istilah_umum", [])
+        )
+        return tuple(all_locations)
+
+    # Fallback ke list minimal jika file tidak ada
+    return (
+        "indonesia", "jakarta", "jawa", "sumatera", "kalimantan",
+        "sulawesi", "papua", "bali", "ntt", "ntb", "maluku",
+    )
+
+
+def _sorted_lokasi_keywords() -> list:
+    """Keyword lokasi terurut panjang-duluan (urutan prioritas lama)"""
+    return [
+        k
+        for k in sorted(_lokasi_keywords_cached(), key=len, reverse=True)
+        if k != "indonesia"
+    ]
+
+
+@lru_cache(maxsize=1)
+def _location_scan_pattern() -> "re.Pattern":
+    """
+    Compile regex scan lokasi sekali per proses
+
+    Lookahead zero-width supaya kemunculan yang tumpang tindih tetap
+    semua terkumpul dalam satu pass findall: prioritas "keyword
+    terpanjang di mana pun posisinya" butuh daftar lengkap kemunculan,
+    bukan cuma match leftmost. Alternatif panjang-duluan, jadi di satu
+    posisi yang tertangkap adalah keyword terpanjang
+    """
+    alternation = "|".join(map(re.escape, _sorted_lokasi_keywords()))
+    return re.compile(r"\b(?=(" + alternation + r")\b)")
+
+
+@lru_cache(maxsize=1)
+def _location_rank() -> dict:
+    """
+    Peringkat prioritas keyword lokasi (angka kecil = menang)
+
+    Urutan sama persis dengan loop sorted panjang-duluan yang lama:
+    keyword terpanjang dulu, seri panjang mengikuti urutan file lokasi.
+    Keyword yang muncul di lebih dari satu kategori file memakai
+    kemunculan pertamanya (setdefault), sama seperti loop lama
+    """
+    rank = {}
+    for i, k in enumerate(_sorted_lokasi_keywords()):
+        rank.setdefault(k, i)
+    return rank
+
+
+_ID_RE = re.compile(r"\bdi\s+indonesia\b")
+
 
 class LocationFilter:
     """Filter berita berdasarkan lokasi Indonesia"""
-    
+
     def __init__(self):
-        self.lokasi_keywords = self._load_lokasi_keywords()
-    
+        # Referensi ke struktur shared (di-load dan dicompile sekali
+        # per proses), bukan parse JSON + compile per instance
+        self.lokasi_keywords = list(_lokasi_keywords_cached())
+        self._loc_scan_re = _location_scan_pattern()
+        self._loc_rank = _location_rank()
+        self._id_re = _ID_RE
+
     def _load_lokasi_keywords(self) -> List[str]:
-        """Load daftar lokasi dari file JSON"""
-        lokasi_file = FILE_PATHS["lokasi_config"]
-        
-        if os.path.exists(lokasi_file):
-            with open(lokasi_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Gabungkan semua kategori
-                all_locations = (
-                    data.get("provinsi", []) +
-                    data.get("kota_kabupaten", []) +
-                    data.get("istilah_umum", [])
-                )
-                return all_locations
-        else:
-            # Fallback ke list minimal jika file tidak ada
-            return [
-                "indonesia", "jakarta", "jawa", "sumatera", "kalimantan",
-                "sulawesi", "papua", "bali", "ntt", "ntb", "maluku",
-            ]
+        """Load daftar lokasi dari file JSON (shared, cached)"""
+        return list(_lokasi_keywords_cached())
     
+    def extract_location_text(self, text_lower: str) -> str:
+        """
+        Ekstrak nama lokasi dari teks yang sudah di-lowercase
+
+        Args:
+            text_lower: Hasil _prep(judul, ringkasan)
+
+        Returns:
+            Nama lokasi yang ditemukan (atau string kosong)
+        """
+        # Cek "di Indonesia" dengan word boundary
+        if self._id_re.search(text_lower):
+            return "Indonesia"
+
+        # Satu pass findall mengumpulkan semua kemunculan keyword,
+        # lalu pilih peringkat tertinggi — keyword terpanjang di mana
+        # pun posisinya, sama dengan loop panjang-duluan yang lama
+        # (bukan sekadar match paling kiri)
+        matches = self._loc_scan_re.findall(text_lower)
+        if matches:
+            return min(set(matches), key=self._loc_rank.__getitem__).title()
+
+        return ""
+
     def extract_location(self, judul: str, ringkasan: str) -> str:
         """
         Ekstrak nama lokasi dari teks berita
-        
+
         Args:
             judul: Judul berita
             ringkasan: Ringkasan berita
-            
+
         Returns:
             Nama lokasi yang ditemukan (atau string kosong)
         """
-        if not isinstance(judul, str):
-            judul = ""
-        if not isinstance(ringkasan, str):
-            ringkasan = ""
-        
-        text_full = f"{judul} {ringkasan}"
-        text_lower = text_full.lower()
-        
-        # Cek "di Indonesia" dengan word boundary
-        if re.search(r"\bdi\s+indonesia\b", text_lower):
-            return "Indonesia"
-        
-        # Cek lokasi spesifik (prioritas lebih panjang dulu)
-        # Sort by length descending untuk match yang lebih spesifik
-        sorted_locations = sorted(self.lokasi_keywords, key=len, reverse=True)
-        
-        for lokasi in sorted_locations:
-            if lokasi == "indonesia":
-                continue  # Skip karena sudah dicek di atas
-            
-            # Cek dengan word boundary untuk akurasi lebih baik
-            pattern = r'\b' + re.escape(lokasi) + r'\b'
-            if re.search(pattern, text_lower):
-                return lokasi.title()
-        
-        return ""
-    
+        return self.extract_location_text(_prep(judul, ringkasan))
+
+    def is_in_indonesia_text(self, text_lower: str) -> bool:
+        """Cek lokasi Indonesia dari teks yang sudah di-lowercase"""
+        return bool(self.extract_location_text(text_lower))
+
     def is_in_indonesia(self, judul: str, ringkasan: str) -> bool:
         """
         Cek apakah berita terjadi di Indonesia
-        
+
         Args:
             judul: Judul berita
             ringkasan: Ringkasan berita
-            
+
         Returns:
             True jika lokasi di Indonesia terdeteksi
         """
         lokasi = self.extract_location(judul, ringkasan)
         return bool(lokasi)
 
+    def extract_location_series(self, text_lower: pd.Series) -> pd.Series:
+        """
+        Versi vectorized dari extract_location untuk satu Series teks
+
+        Args:
+            text_lower: Series teks lowercase
+
+        Returns:
+            Series nama lokasi ("" jika tidak ditemukan)
+        """
+        # str.findall (C-level) mengumpulkan semua kemunculan per
+        # baris; pemilihan prioritas (terpanjang di mana pun posisinya,
+        # sama dengan versi skalar) tinggal min() atas segelintir match
+        rank = self._loc_rank
+        lokasi = text_lower.str.findall(self._loc_scan_re).map(
+            lambda ms: min(set(ms), key=rank.__getitem__).title()
+            if isinstance(ms, list) and ms
+            else ""
+        )
+
+        # "di Indonesia" menang atas match lokasi spesifik, sama
+        # seperti urutan cek di versi skalar
+        id_mask = text_lower.str.contains(self._id_re, na=False)
+        lokasi[id_mask] = "Indonesia"
+
+        return lokasi
+
+
+def _substring_alternation(keywords) -> "re.Pattern":
+    """
+    Compile list keyword jadi satu regex alternation substring
+
+    Tanpa word boundary, supaya semantiknya sama dengan `kw in text`;
+    satu .search() menggantikan satu scan substring per keyword
+    """
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Mapping keyword ke kategori bencana; urutan = prioritas kategori
+_DISASTER_CATEGORIES = {
+    "Banjir": ["banjir", "banjir bandang", "banjir rob"],
+    "Gempa Bumi": ["gempa bumi", "gempa", "lindu"],
+    "Tsunami": ["tsunami"],
+    "Tanah Longsor": ["tanah longsor", "longsor"],
+    "Kebakaran": ["kebakaran hutan", "kebakaran lahan", "kebakaran rumah", "kebakaran permukiman"],
+    "Angin Kencang": ["angin puting beliung", "angin kencang", "puting beliung"],
+    "Erupsi Gunung Api": ["erupsi", "gunung meletus", "erupsi gunung api"],
+    "Kekeringan": ["kekeringan"],
+    "Epidemi": ["wabah", "epidemi", "pandemi"],
+    "Kecelakaan": ["kecelakaan kapal", "kecelakaan laut", "kecelakaan pesawat"],
+    "Konflik Sosial": ["konflik sosial", "bentrok warga"],
+}
+
+# Precompiled sekali di import: satu alternation per kategori/keyword set
+_CATEGORY_PATTERNS = [
+    (category, _substring_alternation(keywords))
+    for category, keywords in _DISASTER_CATEGORIES.items()
+]
+_DISASTER_RE = _substring_alternation(DISASTER_KEYWORDS)
+_NEGATIVE_RE = _substring_alternation(NEGATIVE_KEYWORDS)
+
+# Keyword satu token sebagai frozenset: cek irisan dengan token teks
+# adalah jalur cepat O(tokens) sebelum jatuh ke scan regex.
+# Hit token = pasti hit substring juga, jadi short-circuit-nya aman
+_DISASTER_SINGLE = frozenset(k for k in DISASTER_KEYWORDS if " " not in k)
+_NEG_SINGLE = frozenset(k for k in NEGATIVE_KEYWORDS if " " not in k)
+_EPIDEMIC_CTX_RE = _substring_alternation(EPIDEMIC_CONTEXT)
+_EPIDEMIC_TERMS_RE = _substring_alternation(["wabah", "epidemi", "pandemi"])
+
 
 class DisasterFilter:
-    """Filter berita berdasarkan konteks bencana"""
-    
-    def __init__(self):
-        self.disaster_keywords = DISASTER_KEYWORDS
-        self.negative_keywords = NEGATIVE_KEYWORDS
-        self.epidemic_context = EPIDEMIC_CONTEXT
-    
-    def is_disaster_event(self, judul: str, ringkasan: str) -> bool:
+    """
+    Filter berita berdasarkan konteks bencana
+
+    Near-stateless: semua struktur keyword (tuple, frozenset, regex)
+    hidup di module level dan dibagikan antar instance — tidak ada
+    rebind per instance, method cuma membaca globals precomputed
+    """
+
+    # Referensi ke konstanta module (untuk introspeksi/kompatibilitas)
+    disaster_keywords = DISASTER_KEYWORDS
+    negative_keywords = NEGATIVE_KEYWORDS
+    epidemic_context = EPIDEMIC_CONTEXT
+
+    @staticmethod
+    def is_disaster_event_text(text: str) -> bool:
         """
-        Validasi apakah berita benar-benar tentang bencana
-        
+        Validasi konteks bencana dari teks yang sudah di-lowercase
+
         Args:
-            judul: Judul berita
-            ringkasan: Ringkasan berita
-            
+            text: Hasil _prep(judul, ringkasan)
+
         Returns:
             True jika berita valid sebagai berita bencana
         """
-        if not isinstance(judul, str):
-            judul = ""
-        if not isinstance(ringkasan, str):
-            ringkasan = ""
-        
-        text = f"{judul} {ringkasan}".lower()
-        
-        # 1. Harus mengandung minimal satu keyword bencana
-        has_disaster_keyword = any(kw in text for kw in self.disaster_keywords)
-        if not has_disaster_keyword:
+        tokens = set(text.split())
+
+        # 1. Harus mengandung minimal satu keyword bencana — irisan
+        #    token tunggal dulu (hash C-level), baru scan regex untuk
+        #    frasa multi-kata / match substring
+        if not (tokens & _DISASTER_SINGLE) and not _DISASTER_RE.search(text):
             return False
-        
+
         # 2. Filter negative keywords (false positives)
-        has_negative_keyword = any(neg in text for neg in self.negative_keywords)
-        if has_negative_keyword:
+        if tokens & _NEG_SINGLE or _NEGATIVE_RE.search(text):
             return False
-        
+
         # 3. Validasi khusus untuk berita wabah/epidemi
-        epidemic_terms = ["wabah", "epidemi", "pandemi"]
-        if any(term in text for term in epidemic_terms):
+        if _EPIDEMIC_TERMS_RE.search(text):
             # Harus ada konteks medis yang jelas
-            has_epidemic_context = any(ctx in text for ctx in self.epidemic_context)
-            if not has_epidemic_context:
+            if not _EPIDEMIC_CTX_RE.search(text):
                 return False
-        
+
         return True
-    
-    def get_disaster_type(self, judul: str, ringkasan: str) -> str:
+
+    @staticmethod
+    def is_disaster_event_series(text_lower: pd.Series) -> pd.Series:
         """
-        Deteksi jenis bencana dari teks
-        
+        Versi vectorized: mask konteks bencana untuk satu Series teks
+
+        Logika sama dengan is_disaster_event_text, tapi sebagai
+        operasi boolean antar mask str.contains (C-level)
+
+        Args:
+            text_lower: Series teks lowercase
+
+        Returns:
+            Series boolean
+        """
+        # Tokenisasi sekali untuk kedua keyword set: explode + isin =
+        # set-membership hash C-level, tanpa backtracking regex. Hit
+        # token tunggal memutuskan baris; sisanya baru di-scan regex
+        # (frasa multi-kata / match substring)
+        tokens = text_lower.str.findall(r"\w+").explode()
+
+        def _token_hits(keyword_set) -> pd.Series:
+            mask = pd.Series(False, index=text_lower.index)
+            hits = tokens[tokens.isin(keyword_set)].index.unique()
+            mask.loc[hits] = True
+            return mask
+
+        has_disaster = _token_hits(_DISASTER_SINGLE)
+        rest = text_lower[~has_disaster]
+        if not rest.empty:
+            has_disaster.loc[rest.index] = rest.str.contains(_DISASTER_RE, na=False)
+
+        has_negative = _token_hits(_NEG_SINGLE)
+        rest = text_lower[~has_negative]
+        if not rest.empty:
+            has_negative.loc[rest.index] = rest.str.contains(_NEGATIVE_RE, na=False)
+
+        epidemic_term = text_lower.str.contains(_EPIDEMIC_TERMS_RE, na=False)
+        epidemic_ctx = text_lower.str.contains(_EPIDEMIC_CTX_RE, na=False)
+
+        return has_disaster & ~has_negative & (~epidemic_term | epidemic_ctx)
+
+    @staticmethod
+    def get_disaster_type_series(text_lower: pd.Series) -> pd.Series:
+        """
+        Versi vectorized dari get_disaster_type untuk satu Series teks
+
+        Args:
+            text_lower: Series teks lowercase
+
+        Returns:
+            Series jenis bencana ("Lainnya" jika tidak terdeteksi)
+        """
+        # Satu mask str.contains per kategori + np.select; urutan list
+        # = prioritas kategori, sama dengan loop skalar
+        conditions = [
+            text_lower.str.contains(pattern, na=False)
+            for _, pattern in _CATEGORY_PATTERNS
+        ]
+        categories = [category for category, _ in _CATEGORY_PATTERNS]
+
+        return pd.Series(
+            np.select(conditions, categories, default="Lainnya"),
+            index=text_lower.index,
+        )
+
+    @staticmethod
+    def is_disaster_event(judul: str, ringkasan: str) -> bool:
+        """
+        Validasi apakah berita benar-benar tentang bencana
+
         Args:
             judul: Judul berita
             ringkasan: Ringkasan berita
-            
+
+        Returns:
+            True jika berita valid sebagai berita bencana
+        """
+        return DisasterFilter.is_disaster_event_text(_prep(judul, ringkasan))
+
+    @staticmethod
+    def get_disaster_type_text(text: str) -> str:
+        """
+        Deteksi jenis bencana dari teks yang sudah di-lowercase
+
+        Args:
+            text: Hasil _prep(judul, ringkasan)
+
         Returns:
             Jenis bencana yang terdeteksi
         """
-        text = f"{judul} {ringkasan}".lower()
-        
-        # Mapping keyword ke kategori bencana
-        disaster_categories = {
-            "Banjir": ["banjir", "banjir bandang", "banjir rob"],
-            "Gempa Bumi": ["gempa bumi", "gempa", "lindu"],
-            "Tsunami": ["tsunami"],
-            "Tanah Longsor": ["tanah longsor", "longsor"],
-            "Kebakaran": ["kebakaran hutan", "kebakaran lahan", "kebakaran rumah", "kebakaran permukiman"],
-            "Angin Kencang": ["angin puting beliung", "angin kencang", "puting beliung"],
-            "Erupsi Gunung Api": ["erupsi", "gunung meletus", "erupsi gunung api"],
-            "Kekeringan": ["kekeringan"],
-            "Epidemi": ["wabah", "epidemi", "pandemi"],
-            "Kecelakaan": ["kecelakaan kapal", "kecelakaan laut", "kecelakaan pesawat"],
-            "Konflik Sosial": ["konflik sosial", "bentrok warga"],
-        }
-        
-        for category, keywords in disaster_categories.items():
-            if any(kw in text for kw in keywords):
+        # Satu .search() precompiled per kategori, urutan kategori
+        # dipertahankan sebagai prioritas
+        for category, pattern in _CATEGORY_PATTERNS:
+            if pattern.search(text):
                 return category
-        
+
         return "Lainnya"
 
+    @staticmethod
+    def get_disaster_type(judul: str, ringkasan: str) -> str:
+        """
+        Deteksi jenis bencana dari teks
+
+        Args:
+            judul: Judul berita
+            ringkasan: Ringkasan berita
+
+        Returns:
+            Jenis bencana yang terdeteksi
+        """
+        return DisasterFilter.get_disaster_type_text(_prep(judul, ringkasan))
+
+
+# Pattern normalisasi judul, dicompile sekali di import (re.sub dengan
+# string pattern tetap bayar lookup cache re per call)
+_SPECIAL_RE = re.compile(r"[^0-9a-zA-Z\u00C0-\u024F\u1E00-\u1EFF\s]")
+_WS_RE = re.compile(r"\s+")
+
 
 class TextNormalizer:
     """Normalisasi teks untuk deduplikasi"""
-    
+
     @staticmethod
     def normalize_title(title: str) -> str:
         """
         Normalisasi judul untuk deduplikasi
-        
+
         Args:
             title: Judul berita
-            
+
         Returns:
             Judul yang sudah dinormalisasi
         """
         if not isinstance(title, str):
             return ""
-        
-        # Lowercase
-        t = title.lower()
-        
-        # Hapus karakter spesial, sisakan alphanumeric dan spasi
-        t = re.sub(r"[^0-9a-zA-Z\u00C0-\u024F\u1E00-\u1EFF\s]", " ", t)
-        
-        # Hapus multiple spaces
-        t = re.sub(r"\s+", " ", t).strip()
-        
-        return t
+
+        # Lowercase, hapus karakter spesial (sisakan alphanumeric dan
+        # spasi), rapikan multiple spaces
+        return _WS_RE.sub(" ", _SPECIAL_RE.sub(" ", title.lower())).strip()
     
     @staticmethod
     def clean_domain(domain: str) -> str:
@@ -214,8 +450,20 @@ class TextNormalizer:
         
         # Hapus www.
         domain = domain.replace("www.", "")
-        
+
         # Lowercase
         domain = domain.lower()
-        
-        return domain
\ No newline at end of file
+
+        return domain
+
+
+@lru_cache(maxsize=100_000)
+def normalize_title_cached(title: str) -> str:
+    """
+    normalize_title dengan memoization per judul
+
+    Judul yang sama muncul berulang (artikel yang sama dari beberapa
+    keyword, plus baris lama saat merge) — hasil normalisasinya cukup
+    dihitung sekali per proses
+    """
+    return TextNormalizer.normalize_title(title)
\ No newline at end of file
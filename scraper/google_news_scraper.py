@@ -8,7 +8,12 @@ import json
 import requests
 import feedparser
 import pandas as pd
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
 from typing import Dict, List, Optional, Tuple
 import logging
@@ -19,7 +24,12 @@ from .config import (
     SCRAPING_CONFIG,
     FILE_PATHS
 )
-from .filters import LocationFilter, DisasterFilter, TextNormalizer
+from .filters import (
+    LocationFilter,
+    DisasterFilter,
+    TextNormalizer,
+    normalize_title_cached,
+)
 
 
 # Setup logging
@@ -48,6 +58,25 @@ class GoogleNewsScraper:
         self.location_filter = LocationFilter()
         self.disaster_filter = DisasterFilter()
         self.normalizer = TextNormalizer()
+
+        # Session persisten: connection pool + keep-alive, jadi TLS
+        # handshake ke news.google.com dibayar sekali, bukan per
+        # keyword. Pool disize selaras max_workers; retry dengan
+        # backoff untuk 429/5xx
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {"User-Agent": SCRAPING_CONFIG["user_agent"]}
+        )
         
         # Statistics
         self.stats = {
@@ -56,6 +85,7 @@ class GoogleNewsScraper:
             "articles_after_disaster_filter": 0,
             "articles_after_dedup": 0,
             "articles_with_invalid_dates": 0,
+            "articles_total": 0,
             "keywords_scraped": 0,
             "keywords_failed": 0,
         }
@@ -83,31 +113,106 @@ class GoogleNewsScraper:
         
         return url
     
-    def fetch_rss(self, url: str) -> feedparser.FeedParserDict:
+    def fetch_rss(self, url: str) -> List[Dict]:
         """
-        Fetch RSS feed dari URL
-        
+        Fetch dan parse RSS feed dari URL
+
         Args:
             url: RSS feed URL
-            
+
         Returns:
-            Parsed feed object
+            List of entry dict (title, link, summary, published, source)
         """
         logger.info(f"Fetching: {url}")
-        
-        headers = {
-            "User-Agent": SCRAPING_CONFIG["user_agent"]
-        }
-        
-        response = requests.get(
+
+        response = self.session.get(
             url,
-            headers=headers,
             timeout=SCRAPING_CONFIG["timeout"]
         )
         response.raise_for_status()
-        
-        feed = feedparser.parse(response.text)
-        return feed
+
+        # Parse XML langsung dengan ElementTree (expat, C-level) —
+        # jauh lebih ringan daripada pipeline sgmllib feedparser untuk
+        # payload RSS Google News yang well-formed. feedparser tetap
+        # jadi fallback untuk payload yang bukan XML valid
+        try:
+            return self._parse_rss_xml(response.content)
+        except ET.ParseError as e:
+            logger.warning(f"XML parse failed ({e}), falling back to feedparser")
+            return self._entries_from_feedparser(
+                feedparser.parse(response.content)
+            )
+
+    @staticmethod
+    def _parse_rss_xml(content: bytes) -> List[Dict]:
+        """
+        Parse payload RSS jadi list entry dict via ElementTree
+
+        pubDate RFC-2822 langsung dinormalkan ke ISO di sini supaya
+        process_datetime tetap di fast path format ISO8601
+
+        Args:
+            content: Raw bytes RSS
+
+        Returns:
+            List of entry dict
+        """
+        root = ET.fromstring(content)
+        entries = []
+
+        for item in root.iterfind(".//item"):
+            published = item.findtext("pubDate", "")
+            if published:
+                try:
+                    published = parsedate_to_datetime(published).isoformat()
+                except (TypeError, ValueError):
+                    pass  # biarkan string mentah, diurus process_datetime
+
+            source = item.find("source")
+            entries.append({
+                "title": item.findtext("title", ""),
+                "link": (item.findtext("link", "") or "").strip(),
+                "summary": item.findtext("description", ""),
+                "published": published,
+                "source": source.text if source is not None and source.text else "",
+            })
+
+        return entries
+
+    @staticmethod
+    def _entries_from_feedparser(feed: feedparser.FeedParserDict) -> List[Dict]:
+        """
+        Normalkan entries feedparser ke bentuk dict yang sama dengan
+        _parse_rss_xml (jalur fallback)
+
+        Args:
+            feed: Parsed feed object
+
+        Returns:
+            List of entry dict
+        """
+        entries = []
+
+        for entry in feed.entries:
+            if hasattr(entry, "published_parsed") and entry.published_parsed:
+                dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                published = dt.isoformat()
+            else:
+                published = entry.get("published", "")
+
+            source = ""
+            if "source" in entry and hasattr(entry.source, "title"):
+                source = entry.source.title
+
+            entries.append({
+                "title": entry.get("title", ""),
+                "link": entry.get("link", ""),
+                "summary": entry.get("summary", ""),
+                "published": published,
+                "source": source,
+            })
+
+        return entries
     
     def extract_domain(self, url: str) -> str:
         """
@@ -127,51 +232,56 @@ class GoogleNewsScraper:
             logger.warning(f"Failed to extract domain from {url}: {e}")
             return "unknown"
     
-    def parse_feed_entries(self, feed: feedparser.FeedParserDict, 
-                          keyword: str) -> List[Dict]:
+    def parse_feed_entries(self, entries: List[Dict],
+                          keyword: str) -> Dict[str, list]:
         """
-        Parse entries dari feed menjadi list of dict
-        
+        Parse entries feed menjadi kolom artikel (SoA)
+
+        Layout columnar (dict of list) alih-alih list of dict: tidak
+        ada alokasi PyDict per artikel, dan pd.DataFrame(cols) tinggal
+        mengambil list per kolom tanpa inferensi kolom per baris.
+        Entry yang gagal filter lokasi di-skip di sini — tidak pernah
+        masuk kolom/DataFrame sama sekali
+
         Args:
-            feed: Parsed feed object
+            entries: List entry dict dari fetch_rss
             keyword: Keyword yang digunakan untuk scraping
-            
+
         Returns:
-            List of article dictionaries
+            Dict nama kolom -> list nilai (panjang seragam)
         """
-        results = []
-        
-        for entry in feed.entries:
-            # Extract published date
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                published_str = dt.isoformat()
-            else:
-                published_str = entry.get("published", "")
-            
-            # Extract source
-            link = entry.get("link", "")
-            source = ""
-            if "source" in entry and hasattr(entry.source, "title"):
-                source = entry.source.title
-            
-            domain = self.extract_domain(link)
-            
-            article = {
-                "judul": entry.get("title", ""),
-                "link": link,
-                "ringkasan": entry.get("summary", ""),
-                "tanggal_publikasi": published_str,
-                "sumber": source,
-                "kata_kunci": keyword,
-                "domain": domain,
-            }
-            
-            results.append(article)
-        
-        return results
+        cols = {
+            "judul": [],
+            "link": [],
+            "ringkasan": [],
+            "tanggal_publikasi": [],
+            "sumber": [],
+        }
+
+        for entry in entries:
+            # Prefilter lokasi per entry (satu search regex
+            # precompiled): mayoritas entry non-Indonesia gugur di
+            # worker thread, sebelum alokasi kolom dan pass vectorized
+            if not self.location_filter.is_in_indonesia(
+                entry["title"], entry["summary"]
+            ):
+                continue
+
+            cols["judul"].append(entry["title"])
+            cols["link"].append(entry["link"])
+            cols["ringkasan"].append(entry["summary"])
+            cols["tanggal_publikasi"].append(entry["published"])
+            cols["sumber"].append(entry["source"])
+
+        n = len(cols["judul"])
+        cols["kata_kunci"] = [keyword] * n
+        # Placeholder penjaga urutan kolom; diisi vectorized di
+        # scrape_all_keywords (bukan urlparse per entry)
+        cols["domain"] = [None] * n
+
+        return cols
     
-    def scrape_keyword(self, keyword: str) -> Tuple[List[Dict], bool]:
+    def scrape_keyword(self, keyword: str) -> Tuple[Dict[str, list], int, bool]:
         """
         Scrape berita untuk satu keyword
         
@@ -179,19 +289,22 @@ class GoogleNewsScraper:
             keyword: Keyword untuk search
             
         Returns:
-            Tuple of (list of articles, success status)
+            Tuple of (kolom artikel SoA, jumlah entry mentah, success)
         """
         try:
             url = self.build_search_url(keyword)
             feed = self.fetch_rss(url)
-            articles = self.parse_feed_entries(feed, keyword)
-            
-            logger.info(f"✓ Keyword '{keyword}': {len(articles)} articles")
-            return articles, True
-            
+            cols = self.parse_feed_entries(feed, keyword)
+
+            logger.info(
+                f"✓ Keyword '{keyword}': {len(feed)} fetched, "
+                f"{len(cols['judul'])} after location prefilter"
+            )
+            return cols, len(feed), True
+
         except Exception as e:
             logger.error(f"✗ Keyword '{keyword}' failed: {e}")
-            return [], False
+            return {}, 0, False
     
     def scrape_all_keywords(self, keywords: List[str] = None) -> pd.DataFrame:
         """
@@ -205,25 +318,69 @@ class GoogleNewsScraper:
         """
         if keywords is None:
             keywords = DISASTER_KEYWORDS
-        
-        all_articles = []
-        
-        for keyword in keywords:
-            articles, success = self.scrape_keyword(keyword)
-            
-            if success:
-                self.stats["keywords_scraped"] += 1
-                all_articles.extend(articles)
-            else:
-                self.stats["keywords_failed"] += 1
-        
-        self.stats["articles_fetched"] = len(all_articles)
-        
-        if not all_articles:
+
+        # Akumulasi columnar (SoA): extend list per kolom, tanpa
+        # PyDict per artikel; pd.DataFrame(cols) di akhir tinggal
+        # mengkonversi list per kolom
+        all_cols = {
+            "judul": [],
+            "link": [],
+            "ringkasan": [],
+            "tanggal_publikasi": [],
+            "sumber": [],
+            "kata_kunci": [],
+            "domain": [],
+        }
+        scraped = 0
+        failed = 0
+        fetched = 0
+
+        # Fetch RSS paralel: workload-nya I/O-bound (network), jadi
+        # thread pool memangkas total latency dari ~N fetch berurutan
+        # jadi ~N/workers. Hasil diakumulasi di thread utama via
+        # as_completed, jadi self.stats tidak butuh lock
+        with ThreadPoolExecutor(
+            max_workers=SCRAPING_CONFIG["max_workers"]
+        ) as executor:
+            futures = [
+                executor.submit(self.scrape_keyword, keyword)
+                for keyword in keywords
+            ]
+
+            for future in as_completed(futures):
+                cols, raw_count, success = future.result()
+
+                if success:
+                    scraped += 1
+                    fetched += raw_count
+                    for name, values in cols.items():
+                        all_cols[name].extend(values)
+                else:
+                    failed += 1
+
+        self.stats["keywords_scraped"] += scraped
+        self.stats["keywords_failed"] += failed
+        # Jumlah entry mentah dari feed (sebelum prefilter lokasi)
+        self.stats["articles_fetched"] = fetched
+
+        if not all_cols["judul"]:
             logger.warning("No articles fetched from any keyword")
             return pd.DataFrame()
-        
-        df = pd.DataFrame(all_articles)
+
+        df = pd.DataFrame(all_cols)
+
+        # Domain diekstrak sekali untuk seluruh kolom link (regex +
+        # str.replace C-level), menggantikan urlparse per entry;
+        # semantik sama dengan extract_domain/clean_domain skalar
+        df["domain"] = (
+            df["link"]
+            .str.extract(r"^https?://([^/?#]+)", expand=False)
+            .str.lower()
+            .str.replace("www.", "", regex=False)
+            .replace("", None)
+            .fillna("unknown")
+        )
+
         return df
     
     def apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -238,67 +395,52 @@ class GoogleNewsScraper:
         """
         if df.empty:
             return df
-        
-        # 1. Filter: Lokasi Indonesia
+
+        # Lowercase judul+ringkasan SEKALI, lalu dipakai ulang oleh
+        # semua filter (bukan dialokasikan ulang per filter per baris)
+        text_lower = (
+            df.get("judul", pd.Series("", index=df.index)).fillna("").astype(str)
+            + " "
+            + df.get("ringkasan", pd.Series("", index=df.index)).fillna("").astype(str)
+        ).str.lower()
+
+        # 1. Filter + extract lokasi dalam SATU scan pattern lokasi:
+        # hasil ekstraksi sekaligus jadi mask filter (lokasi != ""),
+        # bukan satu pass contains + satu pass extract terpisah
         logger.info("Applying location filter...")
-        df["lokasi_di_indonesia"] = df.apply(
-            lambda row: self.location_filter.is_in_indonesia(
-                row.get("judul", ""),
-                row.get("ringkasan", "")
-            ),
-            axis=1
-        )
-        df = df[df["lokasi_di_indonesia"]].copy()
+        lokasi = self.location_filter.extract_location_series(text_lower)
+        in_indonesia = lokasi != ""
+
+        df = df[in_indonesia].copy()
+        df["lokasi_kejadian"] = lokasi[in_indonesia]
+        text_lower = text_lower[in_indonesia]
         self.stats["articles_after_location_filter"] = len(df)
-        
+
         if df.empty:
             logger.warning("No articles after location filter")
             return df
-        
+
         # 2. Filter: Konteks bencana
         logger.info("Applying disaster context filter...")
-        df["is_bencana_relevan"] = df.apply(
-            lambda row: self.disaster_filter.is_disaster_event(
-                row.get("judul", ""),
-                row.get("ringkasan", "")
-            ),
-            axis=1
-        )
-        df = df[df["is_bencana_relevan"]].copy()
+        is_bencana = self.disaster_filter.is_disaster_event_series(text_lower)
+        df = df[is_bencana].copy()
+        text_lower = text_lower[is_bencana]
         self.stats["articles_after_disaster_filter"] = len(df)
-        
+
         if df.empty:
             logger.warning("No articles after disaster context filter")
             return df
-        
-        # 3. Extract lokasi kejadian
-        logger.info("Extracting location details...")
-        df["lokasi_kejadian"] = df.apply(
-            lambda row: self.location_filter.extract_location(
-                row.get("judul", ""),
-                row.get("ringkasan", "")
-            ),
-            axis=1
-        )
-        
-        # 4. Detect jenis bencana
-        df["jenis_bencana"] = df.apply(
-            lambda row: self.disaster_filter.get_disaster_type(
-                row.get("judul", ""),
-                row.get("ringkasan", "")
-            ),
-            axis=1
-        )
-        
-        # 5. Normalisasi judul untuk dedup
-        df["judul_bersih"] = df["judul"].apply(
-            self.normalizer.normalize_title
+
+        # 3. Detect jenis bencana (mask per kategori + np.select),
+        # hanya atas baris yang lolos kedua filter
+        df["jenis_bencana"] = self.disaster_filter.get_disaster_type_series(
+            text_lower
         )
-        
-        # Drop kolom helper
-        df = df.drop(columns=["lokasi_di_indonesia", "is_bencana_relevan"], 
-                    errors="ignore")
-        
+
+        # 4. Normalisasi judul untuk dedup (memoized: judul yang sama
+        # dari beberapa keyword cuma dinormalisasi sekali)
+        df["judul_bersih"] = df["judul"].map(normalize_title_cached)
+
         return df
     
     def process_datetime(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -314,13 +456,26 @@ class GoogleNewsScraper:
         if df.empty:
             return df
         
-        # Convert to datetime
+        # Convert to datetime — fast path format ISO8601 (C-level,
+        # tanpa dateutil per baris): parse_feed_entries sudah
+        # menormalkan tanggal ke ISO saat published_parsed ada.
+        # Sisa baris yang gagal (fallback string mentah dari feed)
+        # di-parse ulang dengan inferensi dateutil
         df["datetime_utc"] = pd.to_datetime(
             df["tanggal_publikasi"],
             utc=True,
+            format="ISO8601",
             errors="coerce"
         )
-        
+
+        retry = df["datetime_utc"].isna() & df["tanggal_publikasi"].notna()
+        if retry.any():
+            df.loc[retry, "datetime_utc"] = pd.to_datetime(
+                df.loc[retry, "tanggal_publikasi"],
+                utc=True,
+                errors="coerce"
+            )
+
         # Identify invalid dates
         invalid_dates = df[df["datetime_utc"].isna()]
         self.stats["articles_with_invalid_dates"] = len(invalid_dates)
@@ -333,11 +488,12 @@ class GoogleNewsScraper:
         # Filter out invalid dates
         df = df[df["datetime_utc"].notna()].copy()
         
-        # Convert to WIB
+        # Convert to WIB — satu pass strftime, dua kolom lainnya
+        # cuma slicing string (jauh lebih murah dari strftime ulang)
         df["datetime_wib"] = df["datetime_utc"].dt.tz_convert("Asia/Jakarta")
         df["datetime_wib_excel"] = df["datetime_wib"].dt.strftime("%d-%m-%Y %H:%M:%S")
-        df["tanggal_wib"] = df["datetime_wib"].dt.strftime("%d-%m-%Y")
-        df["waktu_wib"] = df["datetime_wib"].dt.strftime("%H:%M:%S")
+        df["tanggal_wib"] = df["datetime_wib_excel"].str[:10]
+        df["waktu_wib"] = df["datetime_wib_excel"].str[11:]
         
         return df
     
@@ -367,59 +523,144 @@ class GoogleNewsScraper:
         
         return df
     
-    def merge_with_existing(self, df_new: pd.DataFrame) -> pd.DataFrame:
+    def _load_existing_keys(self, csv_path: str) -> pd.DataFrame:
         """
-        Merge dengan data existing di CSV
-        
+        Load kolom kunci dedup (link, judul_bersih) dari data existing
+
+        Mirror Parquet (dirawat layer database) dibaca duluan kalau
+        masih fresh: column pruning + kolom typed, tanpa parse teks
+        CSV. Fallback ke read_csv usecols kalau mirror tidak ada,
+        basi, atau tidak punya kolomnya
+
         Args:
-            df_new: New dataframe
-            
+            csv_path: Path CSV utama
+
+        Returns:
+            DataFrame dua kolom (link, judul_bersih)
+        """
+        parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+
+        if (
+            os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+        ):
+            try:
+                return pd.read_parquet(
+                    parquet_path,
+                    engine="pyarrow",
+                    columns=["link", "judul_bersih"],
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Parquet mirror unreadable ({e}), falling back to CSV"
+                )
+
+        return pd.read_csv(csv_path, usecols=["link", "judul_bersih"])
+
+    def merge_with_existing(self, df_new: pd.DataFrame) -> Tuple[pd.DataFrame, bool]:
+        """
+        Diff batch baru terhadap data existing di CSV
+
+        CSV existing tidak di-load dan di-rewrite penuh lagi: cukup
+        kolom kunci dedup (link, judul_bersih) yang dibaca, lalu baris
+        baru yang kuncinya belum ada ditulis sebagai append. I/O per
+        scrape jadi proporsional ke jumlah artikel baru, bukan ukuran
+        total database
+
+        Args:
+            df_new: New dataframe (sudah melalui process_datetime)
+
         Returns:
-            Merged dataframe
+            Tuple (dataframe untuk ditulis, apakah mode append)
         """
         csv_path = FILE_PATHS["csv_output"]
-        
+
+        # Dedup internal batch baru dulu
+        df_new = self.deduplicate(df_new)
+
         if os.path.exists(csv_path):
-            logger.info(f"Loading existing data from {csv_path}")
+            header = pd.read_csv(csv_path, nrows=0).columns
+
+            if "link" in header and "judul_bersih" in header:
+                logger.info(f"Diffing against existing keys in {csv_path}")
+                existing = self._load_existing_keys(csv_path)
+                existing_keys = pd.MultiIndex.from_arrays(
+                    [existing["link"], existing["judul_bersih"]]
+                )
+
+                # Membership test hashed C-level atas pasangan kunci,
+                # bukan loop Python per baris batch
+                new_keys = pd.MultiIndex.from_arrays(
+                    [df_new["link"], df_new["judul_bersih"]]
+                )
+                df_delta = df_new[~new_keys.isin(existing_keys)]
+                df_delta = df_delta.sort_values("datetime_wib", ascending=False)
+
+                self.stats["articles_after_dedup"] = len(df_delta)
+                self.stats["articles_total"] = len(existing) + len(df_delta)
+                return df_delta, True
+
+            # CSV lama tanpa kolom kunci dedup: satu kali full merge
+            # untuk migrasi, run berikutnya sudah bisa append
+            logger.info("Existing CSV missing dedup keys, doing one-off full merge")
             df_old = pd.read_csv(csv_path)
-            
-            # Ensure judul_bersih exists
             if "judul_bersih" not in df_old.columns:
-                df_old["judul_bersih"] = df_old["judul"].apply(
-                    self.normalizer.normalize_title
+                df_old["judul_bersih"] = df_old["judul"].map(normalize_title_cached)
+
+            # Baris lama dengan datetime_utc tersimpan (ISO): parse
+            # kolomnya langsung — tanpa re-derive empat kolom turunan
+            # dari tanggal_publikasi; batch baru sudah diproses di run()
+            if "datetime_utc" in df_old.columns:
+                df_old["datetime_utc"] = pd.to_datetime(
+                    df_old["datetime_utc"], utc=True, errors="coerce"
                 )
-            
-            # Merge
-            df_all = pd.concat([df_old, df_new], ignore_index=True)
-        else:
-            logger.info("No existing data found, creating new file")
-            df_all = df_new
-        
-        # Recompute datetime untuk consistency
-        df_all = self.process_datetime(df_all)
-        
-        # Dedup global
-        df_all = self.deduplicate(df_all)
-        
-        # Sort by date (newest first)
-        df_all = df_all.sort_values("datetime_wib", ascending=False)
-        df_all = df_all.reset_index(drop=True)
-        
-        return df_all
-    
-    def save_results(self, df: pd.DataFrame) -> None:
+                df_old["datetime_wib"] = df_old["datetime_utc"].dt.tz_convert(
+                    "Asia/Jakarta"
+                )
+                df_all = pd.concat([df_old, df_new], ignore_index=True)
+                df_all = df_all[df_all["datetime_utc"].notna()]
+            else:
+                df_all = pd.concat([df_old, df_new], ignore_index=True)
+                df_all = self.process_datetime(df_all)
+
+            df_all = self.deduplicate(df_all)
+            df_all = df_all.sort_values("datetime_wib", ascending=False)
+            df_all = df_all.reset_index(drop=True)
+
+            self.stats["articles_total"] = len(df_all)
+            return df_all, False
+
+        logger.info("No existing data found, creating new file")
+        df_new = df_new.sort_values("datetime_wib", ascending=False)
+        df_new = df_new.reset_index(drop=True)
+        self.stats["articles_total"] = len(df_new)
+        return df_new, False
+
+    def save_results(self, df: pd.DataFrame, append: bool = False) -> None:
         """
         Save results to CSV
-        
+
         Args:
             df: Dataframe to save
+            append: Append baris baru ke CSV existing (tanpa rewrite)
         """
         csv_path = FILE_PATHS["csv_output"]
-        
+
         # Ensure directory exists
         os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-        
-        # Save
+
+        if append and os.path.exists(csv_path):
+            # Selaraskan urutan kolom dengan header existing; encoding
+            # utf-8 polos (utf-8-sig akan menyisipkan BOM di tengah
+            # file saat append)
+            header = pd.read_csv(csv_path, nrows=0).columns
+            df = df.reindex(columns=header)
+            df.to_csv(
+                csv_path, mode="a", header=False, index=False, encoding="utf-8"
+            )
+            logger.info(f"Appended {len(df)} new articles to {csv_path}")
+            return
+
         df.to_csv(csv_path, index=False, encoding="utf-8-sig")
         logger.info(f"Saved {len(df)} articles to {csv_path}")
     
@@ -503,23 +744,24 @@ class GoogleNewsScraper:
                 logger.warning("No articles with valid dates. Exiting.")
                 return {"status": "NO_VALID_DATES", "articles": 0}
             
-            # 4. Merge with existing data
-            df_final = self.merge_with_existing(df_processed)
-            
-            # 5. Save results
-            self.save_results(df_final)
+            # 4. Diff dengan data existing (hanya baris baru)
+            df_final, append = self.merge_with_existing(df_processed)
+
+            # 5. Save results (append delta, atau full write saat
+            # file belum ada / migrasi)
+            self.save_results(df_final, append=append)
             self.save_metadata()
-            
+
             logger.info("=" * 50)
             logger.info("Scraping completed successfully!")
-            logger.info(f"Total articles in database: {len(df_final)}")
+            logger.info(f"Total articles in database: {self.stats['articles_total']}")
             logger.info(f"New articles: {self.stats['articles_after_dedup']}")
             logger.info("=" * 50)
-            
+
             return {
                 "status": "SUCCESS",
                 "articles_new": self.stats["articles_after_dedup"],
-                "articles_total": len(df_final),
+                "articles_total": self.stats["articles_total"],
                 "statistics": self.stats,
                 "dataframe": df_final
             }